@@ -3,17 +3,30 @@
 Адаптирован из main_refactored.py
 """
 
+import atexit
+import itertools
+import json
+import os
+import random
+import re
+import shutil
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional, List
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+try:
+    import requests
+except ImportError:
+    requests = None
 
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import (
-    NoSuchElementException,
     TimeoutException,
     StaleElementReferenceException
 )
@@ -25,6 +38,9 @@ from .selenium_helper import SeleniumHelper
 from .vacancy import VacancyCard
 from .modal import ApplicationModal
 
+# Извлечение id вакансий из HTML страницы поиска без браузера
+_VACANCY_HREF_RE = re.compile(r"/vacancy/(\d+)")
+
 
 class HHApplierBot:
     """Главный класс бота для автоматических откликов"""
@@ -39,17 +55,70 @@ class HHApplierBot:
         "[class*='account-popup']",
         "a[href*='/applicant/resumes']",
     ]
-    
+
+    # Объединённые селекторы: один find_elements вместо цикла запросов к браузеру
+    AUTH_SELECTOR = ", ".join(AUTH_SELECTORS)
+
+    # Файл с данными живой сессии Chrome (для reuse_session)
+    SESSION_FILE = ".chrome_session.json"
+    SESSION_TTL = 12 * 3600
+
     def __init__(self, config_path: str = "config.yaml"):
         self.config = Config.load(config_path)
         self.logger = Logger(debug_mode=self.config.debug)
-        self.driver: Optional[webdriver.Chrome] = None
-        self.helper: Optional[SeleniumHelper] = None
-        self.modal: Optional[ApplicationModal] = None
         self.storage: Optional[VacancyStorage] = None
-    
-    def _create_driver(self) -> webdriver.Chrome:
+        # Ключевые слова компилируем в один регекс: одна проверка C-автоматом
+        # вместо цикла подстрочных сравнений на каждой карточке
+        self._keyword_pattern = None
+        if self.config.allowed_keywords:
+            self._keyword_pattern = re.compile(
+                "|".join(re.escape(kw) for kw in self.config.allowed_keywords),
+                re.IGNORECASE
+            )
+        # driver/helper/modal хранятся по-потоково: при max_concurrency > 1
+        # каждый рабочий поток получает собственное окно Chrome
+        self._local = threading.local()
+        self._worker_counter = itertools.count(1)
+        self._worker_drivers: List[webdriver.Chrome] = []
+        self._worker_drivers_lock = threading.Lock()
+
+    @property
+    def driver(self) -> Optional[webdriver.Chrome]:
+        return getattr(self._local, 'driver', None)
+
+    @driver.setter
+    def driver(self, value) -> None:
+        self._local.driver = value
+
+    @property
+    def helper(self) -> Optional[SeleniumHelper]:
+        return getattr(self._local, 'helper', None)
+
+    @helper.setter
+    def helper(self, value) -> None:
+        self._local.helper = value
+
+    @property
+    def modal(self) -> Optional[ApplicationModal]:
+        return getattr(self._local, 'modal', None)
+
+    @modal.setter
+    def modal(self, value) -> None:
+        self._local.modal = value
+
+    @property
+    def http(self):
+        return getattr(self._local, 'http', None)
+
+    @http.setter
+    def http(self, value) -> None:
+        self._local.http = value
+
+    def _create_driver(self, user_data_dir: Optional[str] = None) -> webdriver.Chrome:
         chrome_options = Options()
+        # 'eager' возвращает управление после DOMContentLoaded,
+        # не дожидаясь картинок, шрифтов и рекламных скриптов
+        chrome_options.page_load_strategy = self.config.page_load_strategy
         chrome_options.add_argument("start-maximized")
         chrome_options.add_argument("--disable-extensions")
         chrome_options.add_argument("--disable-gpu")
@@ -58,15 +127,40 @@ class HHApplierBot:
         chrome_options.add_argument("--disable-infobars")
         chrome_options.add_argument("--disable-notifications")
         chrome_options.add_argument("--disable-popup-blocking")
-        
-        chrome_options.add_experimental_option("prefs", {
-            "profile.managed_default_content_settings.images": 2,
-            "profile.default_content_setting_values.notifications": 2
-        })
+
+        # Отключаем фоновые подсистемы Chrome (перевод, Safe Browsing,
+        # component updater и т.п.) — боту они не нужны и только едят CPU
+        chrome_options.add_argument("--disable-background-networking")
+        chrome_options.add_argument("--disable-background-timer-throttling")
+        chrome_options.add_argument("--disable-breakpad")
+        chrome_options.add_argument("--disable-client-side-phishing-detection")
+        chrome_options.add_argument("--disable-component-update")
+        chrome_options.add_argument("--disable-default-apps")
+        chrome_options.add_argument("--disable-hang-monitor")
+        chrome_options.add_argument("--disable-prompt-on-repost")
+        chrome_options.add_argument("--disable-sync")
+        chrome_options.add_argument("--disable-translate")
+        chrome_options.add_argument("--metrics-recording-only")
+        chrome_options.add_argument("--no-first-run")
+        chrome_options.add_argument("--safebrowsing-disable-auto-update")
+        chrome_options.add_argument("--password-store=basic")
+        chrome_options.add_argument("--use-mock-keychain")
+
+        prefs = {
+            "profile.default_content_setting_values.notifications": 2,
+            "disk-cache-size": 4096,
+        }
+        if not self.config.load_images:
+            chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+            prefs["profile.managed_default_content_settings.images"] = 2
+        chrome_options.add_experimental_option("prefs", prefs)
         chrome_options.add_experimental_option('excludeSwitches', ['enable-logging'])
         
-        if self.config.chrome_profile:
-            profile_dir = Path(self.config.chrome_profile).absolute()
+        profile = user_data_dir or self.config.chrome_profile
+        if profile:
+            profile_dir = Path(profile).absolute()
+            if user_data_dir is None and self.config.chrome_profile_tmpfs:
+                profile_dir = self._tmpfs_profile(profile_dir)
             chrome_options.add_argument(f"--user-data-dir={profile_dir}")
             chrome_options.add_argument(f"--profile-directory={self.config.profile_name}")
         
@@ -74,225 +168,534 @@ class HHApplierBot:
             chrome_options.add_argument("--headless=new")
         
         driver = webdriver.Chrome(options=chrome_options)
+        # Неявное ожидание накладывается на КАЖДЫЙ find_element — при
+        # значении по умолчанию 0 промахи возвращаются мгновенно, а там,
+        # где реально нужно подождать, используются явные WebDriverWait
         driver.implicitly_wait(self.config.timeouts.implicit_wait)
+        self._block_tracker_urls(driver)
         return driver
+
+    def _tmpfs_profile(self, profile_dir: Path) -> Path:
+        """Подкладывает копию профиля Chrome в tmpfs (/dev/shm).
+
+        Chrome на старте читает сотни мелких файлов профиля; из RAM это
+        заметно быстрее, чем с диска. Изменения (куки, сессия) при выходе
+        синхронизируются обратно в исходную директорию.
+        """
+        shm = Path("/dev/shm")
+        if not shm.is_dir():
+            self.logger.debug("tmpfs недоступен, используем профиль на диске")
+            return profile_dir
+
+        tmpfs_dir = shm / f"hh-profile-{os.getpid()}"
+        if profile_dir.exists():
+            shutil.copytree(
+                profile_dir, tmpfs_dir,
+                ignore=shutil.ignore_patterns("Singleton*", "*.lock"),
+                dirs_exist_ok=True
+            )
+
+        def _sync_back(src=tmpfs_dir, dst=profile_dir):
+            try:
+                if src.exists():
+                    shutil.copytree(
+                        src, dst,
+                        ignore=shutil.ignore_patterns("Singleton*", "*.lock"),
+                        dirs_exist_ok=True
+                    )
+                    shutil.rmtree(src, ignore_errors=True)
+            except OSError:
+                pass
+
+        atexit.register(_sync_back)
+        return tmpfs_dir
+
+    # Шрифты не нужны боту — режем их на сетевом уровне
+    FONT_URL_PATTERNS = ["*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot"]
+    # Картинки при load_images=False не рендерятся, но сетевые запросы
+    # за ними браузер всё равно шлёт — блокируем и их
+    IMAGE_URL_PATTERNS = ["*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg"]
+
+    def _block_tracker_urls(self, driver: webdriver.Chrome) -> None:
+        """Блокирует рекламу, аналитику и лишние ресурсы через CDP"""
+        blocked = list(self.config.blocked_url_patterns or [])
+        blocked += self.FONT_URL_PATTERNS
+        if not self.config.load_images:
+            blocked += self.IMAGE_URL_PATTERNS
+        if not blocked:
+            return
+        try:
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": blocked})
+            # Явно оставляем HTTP-кэш включённым: повторные страницы
+            # поиска отдаются из кэша, а не из сети
+            driver.execute_cdp_cmd(
+                "Network.setCacheDisabled", {"cacheDisabled": False}
+            )
+        except Exception as e:
+            # Не критично: бот работает и без блокировки трекеров
+            self.logger.debug(f"Не удалось включить блокировку URL: {e}")
     
-    def _is_logged_in(self) -> bool:
-        for selector in self.AUTH_SELECTORS:
+    def _save_session(self) -> None:
+        """Сохраняет параметры сессии Chrome для повторного подключения"""
+        try:
+            data = {
+                "executor_url": self._executor_url(),
+                "session_id": self.driver.session_id,
+                "timestamp": time.time(),
+            }
+            with open(self.SESSION_FILE, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+        except Exception as e:
+            self.logger.debug(f"Не удалось сохранить сессию: {e}")
+
+    def _executor_url(self) -> str:
+        """Возвращает адрес chromedriver текущей сессии.
+
+        В новых Selenium 4 адрес переехал в client_config, в старых
+        лежал в приватном _url — пробуем оба.
+        """
+        executor = self.driver.command_executor
+        client_config = getattr(executor, 'client_config', None)
+        if client_config is not None:
+            return client_config.remote_server_addr
+        return executor._url
+
+    def _detach_service(self) -> None:
+        """Отвязывает процесс chromedriver от финализатора Selenium.
+
+        Service.stop() (его зовёт и __del__ при выходе интерпретатора)
+        убивает chromedriver — а вместе с ним и сессию Chrome, которую
+        мы оставляем открытой. Обнуляем ссылку на процесс: финализатору
+        нечего останавливать, chromedriver доживает до следующего
+        запуска. У сессии, подхваченной через Remote, сервиса нет.
+        """
+        service = getattr(self.driver, 'service', None)
+        if service is not None:
+            service.process = None
+
+    def _try_attach_session(self):
+        """Пытается подключиться к Chrome, оставшемуся от прошлого запуска"""
+        if not self.config.reuse_session or not os.path.exists(self.SESSION_FILE):
+            return None
+
+        try:
+            with open(self.SESSION_FILE, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+
+            # Протухшие сессии не трогаем
+            if time.time() - data.get("timestamp", 0) > self.SESSION_TTL:
+                return None
+
+            from selenium.webdriver.remote.webdriver import WebDriver as RemoteWebDriver
+
+            # Подменяем newSession, чтобы Remote подключился
+            # к существующей сессии вместо создания новой
+            original_execute = RemoteWebDriver.execute
+
+            def _execute(driver_self, command, params=None):
+                if command == "newSession":
+                    return {"success": 0,
+                            "value": {"capabilities": {}},
+                            "sessionId": data["session_id"]}
+                return original_execute(driver_self, command, params)
+
+            RemoteWebDriver.execute = _execute
             try:
-                element = self.driver.find_element(By.CSS_SELECTOR, selector)
-                if element.is_displayed():
-                    self.logger.debug(f"Найден элемент авторизации: {selector}")
-                    return True
-            except NoSuchElementException:
-                continue
-        self.logger.debug("Авторизация не обнаружена")
-        return False
+                driver = webdriver.Remote(
+                    command_executor=data["executor_url"],
+                    options=Options()
+                )
+            finally:
+                RemoteWebDriver.execute = original_execute
+
+            driver.session_id = data["session_id"]
+            driver.current_url  # проверяем, что сессия ещё жива
+            self.logger.debug("Подключились к Chrome из прошлого запуска")
+            return driver
+
+        except Exception as e:
+            self.logger.debug(f"Сохранённая сессия недоступна: {e}")
+            try:
+                os.remove(self.SESSION_FILE)
+            except OSError:
+                pass
+            return None
+
+    def _setup_session(self, driver: webdriver.Chrome) -> None:
+        """Привязывает driver/helper/modal к текущему потоку"""
+        self.driver = driver
+        self.helper = SeleniumHelper(driver)
+        self.modal = ApplicationModal(driver, self.helper, self.config.timeouts)
+        self.http = None
+
+    def _init_http_session(self) -> None:
+        """Создаёт requests-сессию с куками браузера для разведки страниц.
+
+        Страница поиска, на которой нет новых вакансий, не стоит рендера
+        в Chrome — достаточно дешёвого GET, чтобы это выяснить.
+        """
+        if requests is None or not self.config.http_prefilter:
+            return
+        try:
+            session = requests.Session()
+            for cookie in self.driver.get_cookies():
+                session.cookies.set(
+                    cookie['name'], cookie['value'],
+                    domain=cookie.get('domain')
+                )
+            session.headers['User-Agent'] = self.driver.execute_script(
+                "return navigator.userAgent"
+            )
+            self.http = session
+            self.logger.debug("HTTP-сессия для разведки страниц готова")
+        except Exception as e:
+            self.logger.debug(f"Не удалось создать HTTP-сессию: {e}")
+            self.http = None
+
+    def _fetch_page_ids(self, page_num: int) -> Optional[List[str]]:
+        """Возвращает id вакансий страницы через HTTP или None при сбое"""
+        if self.http is None:
+            return None
+        try:
+            url = self._get_next_page_url(page_num)
+            response = self.http.get(url, timeout=5)
+            if response.status_code != 200:
+                return None
+            # dict.fromkeys сохраняет порядок и убирает дубли ссылок
+            return list(dict.fromkeys(_VACANCY_HREF_RE.findall(response.text)))
+        except Exception as e:
+            self.logger.debug("HTTP-разведка страницы %s не удалась: %s", page_num, e)
+            return None
+
+    def _create_worker_driver(self) -> webdriver.Chrome:
+        """Создаёт драйвер рабочего потока с копией авторизованного профиля"""
+        worker_num = next(self._worker_counter)
+        worker_profile = None
+
+        if self.config.chrome_profile:
+            src_dir = Path(self.config.chrome_profile).absolute()
+            worker_profile = f"{src_dir}_worker{worker_num}"
+            if src_dir.exists():
+                # Копируем профиль, чтобы куки авторизации достались потоку,
+                # а Chrome не дрался за блокировку одной директории
+                shutil.copytree(
+                    src_dir, worker_profile,
+                    ignore=shutil.ignore_patterns("Singleton*", "*.lock"),
+                    dirs_exist_ok=True
+                )
+
+        driver = self._create_driver(user_data_dir=worker_profile)
+        with self._worker_drivers_lock:
+            self._worker_drivers.append(driver)
+        return driver
+
+    def _worker_process_query(self, query: dict) -> None:
+        """Обрабатывает поисковый запрос в рабочем потоке"""
+        if self.driver is None:
+            try:
+                self._setup_session(self._create_worker_driver())
+            except Exception as e:
+                self.logger.error(f"Не удалось запустить Chrome для потока: {e}")
+                return
+            # HTTP-сессию здесь не создаём: свежий драйвер стоит на
+            # about:blank и кук ещё не имеет — она поднимется после
+            # первой загрузки страницы поиска
+
+        try:
+            self._process_search_query(query)
+        finally:
+            self.storage.save(force=True)
+
+    # Поиск и проверка видимости элементов авторизации одним вызовом JS,
+    # без исключений на отрицательный результат
+    _AUTH_CHECK_JS = (
+        "return Array.from(document.querySelectorAll(arguments[0]))"
+        ".some(e => e.offsetParent !== null);"
+    )
+
+    def _is_logged_in(self) -> bool:
+        try:
+            logged_in = bool(self.driver.execute_script(
+                self._AUTH_CHECK_JS, self.AUTH_SELECTOR
+            ))
+        except Exception as e:
+            self.logger.debug(f"Ошибка проверки авторизации: {e}")
+            return False
+
+        if logged_in:
+            self.logger.debug("Найден элемент авторизации")
+        else:
+            self.logger.debug("Авторизация не обнаружена")
+        return logged_in
     
+    # Сколько секунд ждём, пока пользователь залогинится в браузере
+    LOGIN_WAIT = 120
+
     def _wait_for_login(self) -> bool:
         print("\n" + "=" * 60)
         print("🔐 ТРЕБУЕТСЯ АВТОРИЗАЦИЯ")
         print("=" * 60)
         print("👉 Войди в свой аккаунт в открывшемся окне браузера")
-        print("👉 После успешного входа вернись сюда и нажми Enter")
+        print(f"👉 Бот продолжит сам, как только увидит авторизацию (до {self.LOGIN_WAIT} сек)")
         print("=" * 60)
-        input("\n⏎ Нажми Enter после авторизации... ")
-        
-        self.driver.refresh()
-        time.sleep(self.config.timeouts.page_load_wait)
-        
-        if not self._is_logged_in():
+
+        # Опрашиваем страницу раз в секунду вместо блокировки на input():
+        # бот стартует сразу после входа, без Enter и лишнего refresh
+        try:
+            WebDriverWait(self.driver, self.LOGIN_WAIT, poll_frequency=1.0).until(
+                lambda d: self._is_logged_in()
+            )
+        except TimeoutException:
             print("\n❌ Авторизация не обнаружена!")
             print("\n📋 Проверь, что:")
             print("   1. ✓ Прошел авторизацию полностью")
             print("   2. ✓ Страница hh.ru загрузилась")
             print("   3. ✓ Видишь свой профиль в правом верхнем углу")
             return False
-        
+
         print("\n✅ Авторизация успешна!")
         return True
     
     def _get_vacancy_cards(self) -> List:
         return self.driver.find_elements(By.CSS_SELECTOR, self.VACANCY_CARD_SELECTOR)
-    
-    def _process_card(self, card_element) -> None:
-        if self.config.debug:
+
+    def _collect_card_metadata(self) -> List[dict]:
+        """Возвращает метаданные всех карточек страницы одним запросом"""
+        return VacancyCard.bulk_extract(self.driver, self.VACANCY_CARD_SELECTOR)
+
+    def _back_to_search(self, url: Optional[str] = None, timeout: float = 2.0) -> None:
+        """Возвращается на страницу поиска и ждёт её по URL.
+
+        При известном адресе страницы грузит его напрямую через get():
+        он отдаётся из bfcache/HTTP-кэша и, в отличие от back(), не
+        зависит от глубины истории после редиректов. Ожидание
+        завершается сразу, как только URL снова указывает на поиск.
+        """
+        if url:
+            self.driver.get(url)
+        else:
+            self.driver.back()
+        try:
+            WebDriverWait(self.driver, timeout, poll_frequency=0.1).until(
+                lambda d: 'search/vacancy' in d.current_url
+            )
+        except TimeoutException:
+            pass
+
+    def _process_card(self, card_element, meta: Optional[dict] = None) -> None:
+        # Горячие атрибуты — в локальные переменные: driver/modal
+        # к тому же property с обращением к threading.local
+        cfg = self.config
+        storage = self.storage
+        driver = self.driver
+        modal = self.modal
+
+        if cfg.debug:
             print("\n" + "=" * 80)
-        
-        card = VacancyCard(card_element, self.helper)
+
+        card = VacancyCard(
+            card_element, self.helper,
+            vacancy_id=meta.get('id') if meta else None,
+            title=meta.get('title') if meta else None,
+        )
         vacancy_id = card.id
         title = card.title
-        
+
         if not title:
             self.logger.debug("Не удалось получить заголовок")
             return
-        
-        if self.storage.is_processed(vacancy_id):
-            self.logger.debug(f"✓ Уже откликнулись: {title[:50]}...")
+
+        if storage.is_processed(vacancy_id):
+            self.logger.debug("✓ Уже откликнулись: %.50s...", title)
             return
-        
-        if self.storage.is_skipped(vacancy_id):
-            self.logger.debug(f"⊗ Уже пропущено: {title[:50]}...")
+
+        if storage.is_skipped(vacancy_id):
+            self.logger.debug("⊗ Уже пропущено: %.50s...", title)
             return
-        
+
         # Показываем вакансию красиво
         print(f"\n  📋 {title}")
-        
-        if self.config.allowed_keywords and not card.is_suitable(self.config.allowed_keywords):
+
+        if self._keyword_pattern and not card.is_suitable(self._keyword_pattern):
             print("     ⊗ Пропуск: не подходит по ключевым словам")
-            self.storage.mark_skipped(vacancy_id, title, "not_suitable_keywords")
+            storage.mark_skipped(vacancy_id, title, "not_suitable_keywords")
             return
-        
+
         btn = card.get_apply_button()
         if not btn:
             print("     ✓ Уже откликались ранее")
-            self.storage.mark_processed(vacancy_id, title, "already_applied")
+            storage.mark_processed(vacancy_id, title, "already_applied")
             return
-        
-        search_page_url = self.driver.current_url
-        
-        if not self.modal.open(btn):
-            current_url = self.driver.current_url
+
+        search_page_url = driver.current_url
+        applied = False
+
+        if not modal.open(btn):
+            current_url = driver.current_url
             if current_url != search_page_url:
                 print("     ⊗ Пропуск: обязательный тест (редирект)")
-                self.storage.mark_skipped(vacancy_id, title, "mandatory_test_redirect")
-                self.driver.back()
-                time.sleep(0.2)
+                storage.mark_skipped(vacancy_id, title, "mandatory_test_redirect")
+                self._back_to_search(search_page_url)
             else:
                 print("     ⚠ Не удалось открыть форму отклика")
             return
-        
+
         try:
-            if self.modal.has_mandatory_test():
+            if modal.has_mandatory_test():
                 print("     ⊗ Пропуск: обязательный тест")
-                self.storage.mark_skipped(vacancy_id, title, "mandatory_test")
-                self.modal.close()
-                # Убеждаемся, что вернулись на страницу поиска
-                if 'search/vacancy' not in self.driver.current_url:
-                    self.driver.back()
-                    time.sleep(0.5)
+                storage.mark_skipped(vacancy_id, title, "mandatory_test")
+                # Закрытие модалки и возврат на поиск сделает finally
                 return
-            
-            self.modal.choose_resume(title, self.config.resume_rules)
-            
+
+            modal.choose_resume(cfg.pick_resume(title))
+
             added_letter = False
-            if self.modal.is_cover_letter_required():
-                added_letter = self.modal.add_cover_letter(self.config.cover_letter)
+            if modal.is_cover_letter_required():
+                added_letter = modal.add_cover_letter(cfg.cover_letter)
                 if not added_letter:
                     print("     ⊗ Пропуск: не удалось добавить сопроводительное письмо")
-                    self.storage.mark_skipped(vacancy_id, title, "cover_letter_failed")
-                    self.modal.close()
-                    if 'search/vacancy' not in self.driver.current_url:
-                        self.driver.back()
-                        time.sleep(0.5)
+                    storage.mark_skipped(vacancy_id, title, "cover_letter_failed")
                     return
-            
-            success = self.modal.submit()
-            
+
+            success = modal.submit()
+
             if success:
                 letter_icon = '📝' if added_letter else '📄'
                 print(f"     ✅ Отклик отправлен {letter_icon}")
-                self.storage.mark_processed(vacancy_id, title, "applied", added_letter)
+                storage.mark_processed(vacancy_id, title, "applied", added_letter)
+                applied = True
             else:
                 print("     ⚠ Не удалось отправить отклик")
-                self.storage.mark_skipped(vacancy_id, title, "submit_failed")
-            
-            if 'search/vacancy' not in self.driver.current_url:
-                self.driver.back()
-                time.sleep(0.5)
-                
+                storage.mark_skipped(vacancy_id, title, "submit_failed")
+
         except Exception as e:
             error_msg = str(e)[:80]
             print(f"     ❌ Ошибка: {error_msg}")
-            self.storage.mark_skipped(vacancy_id, title, f"error: {str(e)[:100]}")
+            storage.mark_skipped(vacancy_id, title, f"error: {str(e)[:100]}")
         finally:
-            self.modal.close()
-            if 'search/vacancy' not in self.driver.current_url:
-                self.driver.back()
-                time.sleep(0.5)
+            teardown_started = time.monotonic()
+            # Закрываем только реально открытую модалку: после удачной
+            # отправки её уже нет, и close() впустую перебирал селекторы
+            if modal.is_open():
+                modal.close()
+            if 'search/vacancy' not in driver.current_url:
+                self._back_to_search(search_page_url)
+
+            if applied and cfg.delay_between_applies > 0:
+                # Пауза против rate-limit со случайным джиттером; время,
+                # ушедшее на закрытие модалки и возврат, идёт в зачёт паузы
+                delay = cfg.delay_between_applies * random.uniform(0.7, 1.3)
+                remaining = delay - (time.monotonic() - teardown_started)
+                if remaining > 0:
+                    time.sleep(remaining)
     
-    def _get_next_page_url(self, current_page: int) -> str:
-        """Формирует URL следующей страницы"""
-        current_url = self.driver.current_url
-        
-        # Если в URL уже есть параметр page, заменяем его
-        if 'page=' in current_url:
-            import re
-            next_url = re.sub(r'page=\d+', f'page={current_page + 1}', current_url)
-        else:
-            # Добавляем параметр page
-            separator = '&' if '?' in current_url else '?'
-            next_url = f"{current_url}{separator}page={current_page + 1}"
-        
-        return next_url
+    def _get_next_page_url(self, next_page: int) -> str:
+        """Формирует URL страницы с указанным номером"""
+        parts = urlsplit(self.driver.current_url)
+        query = dict(parse_qsl(parts.query, keep_blank_values=True))
+        query['page'] = str(next_page)
+        return urlunsplit(parts._replace(query=urlencode(query)))
     
-    def _has_next_page(self, current_page: int) -> bool:
-        """Проверяет наличие следующей страницы через пагинацию"""
-        time.sleep(0.3)
-        
+    PAGER_SELECTORS = [
+        "[data-qa='pager-page']",
+        ".bloko-button[data-page]",
+        "a[data-page]",
+    ]
+
+    PAGER_SELECTOR = ", ".join(PAGER_SELECTORS)
+
+    # Количество страниц выдачи из стора React-приложения hh.ru —
+    # один вызов JS вместо разбора пагинатора по ссылкам
+    _TOTAL_PAGES_JS = """
+        const st = window.__INITIAL_STATE__ || window.initialState;
+        if (!st) return null;
+        const sr = st.searchVacancyResult || st.vacancySearchResult || {};
+        if (typeof sr.pagesCount === 'number') return sr.pagesCount;
+        const paging = sr.paging || {};
+        if (paging.lastPage && typeof paging.lastPage.page === 'number') {
+            return paging.lastPage.page + 1;
+        }
+        return null;
+    """
+
+    def _get_total_pages(self) -> Optional[int]:
+        """Возвращает число страниц выдачи из window.__INITIAL_STATE__.
+
+        None — стор недоступен (разметка изменилась); тогда пагинация
+        проверяется по DOM через _has_next_page.
+        """
         try:
-            # Ищем все ссылки на страницы в пагинаторе
-            page_links = self.driver.find_elements(
-                By.CSS_SELECTOR, 
-                "[data-qa='pager-page'], .bloko-button[data-page], a[data-page]"
-            )
-            
-            if page_links:
-                # Проверяем, есть ли ссылка на следующую страницу
-                for link in page_links:
-                    try:
-                        page_num = link.get_attribute("data-page") or link.text.strip()
-                        if page_num and page_num.isdigit() and int(page_num) == current_page + 1:
-                            self.logger.debug(f"✓ Найдена страница {current_page + 1}")
-                            return True
-                    except:
-                        continue
-            
-            # Альтернатива - проверяем максимальный номер страницы
-            max_page_elem = self.driver.find_elements(
-                By.CSS_SELECTOR,
-                "[data-qa='pager-page']:last-of-type, .bloko-button[data-page]:last-of-type"
-            )
-            
-            if max_page_elem:
+            total = self.driver.execute_script(self._TOTAL_PAGES_JS)
+            if isinstance(total, int) and total > 0:
+                return total
+        except Exception as e:
+            self.logger.debug("Не удалось прочитать pagesCount: %s", e)
+        return None
+
+    def _has_next_page(self, current_page: int, stride: int = 1) -> bool:
+        """Проверяет наличие страницы current_page + stride через пагинацию"""
+        # Ждём отрисовки пагинатора вместо фиксированной паузы
+        self.helper.wait_for_any(self.PAGER_SELECTORS, timeout=0.5)
+
+        target_page = current_page + stride
+
+        try:
+            # Один запрос к браузеру на весь пагинатор,
+            # дальше разбираем номера страниц уже в Python
+            page_links = self.driver.find_elements(By.CSS_SELECTOR, self.PAGER_SELECTOR)
+
+            max_page = 0
+            for link in page_links:
                 try:
-                    max_page = int(max_page_elem[-1].text.strip())
-                    has_next = current_page < max_page
-                    if has_next:
-                        self.logger.debug(f"✓ Есть ещё страницы (текущая: {current_page}, максимум: {max_page})")
-                    else:
-                        self.logger.debug(f"✗ Достигнута последняя страница (текущая: {current_page}, максимум: {max_page})")
-                    return has_next
+                    page_num = link.get_attribute("data-page") or link.text.strip()
+                    if page_num and page_num.isdigit():
+                        num = int(page_num)
+                        if num == target_page:
+                            self.logger.debug("✓ Найдена страница %s", target_page)
+                            return True
+                        max_page = max(max_page, num)
                 except:
-                    pass
-                    
+                    continue
+
+            if max_page:
+                has_next = target_page <= max_page
+                if has_next:
+                    self.logger.debug("✓ Есть ещё страницы (текущая: %s, максимум: %s)",
+                                      current_page, max_page)
+                else:
+                    self.logger.debug("✗ Достигнута последняя страница (текущая: %s, максимум: %s)",
+                                      current_page, max_page)
+                return has_next
+
         except Exception as e:
-            self.logger.debug(f"✗ Ошибка проверки пагинации: {e}")
+            self.logger.debug("✗ Ошибка проверки пагинации: %s", e)
         
         self.logger.debug("✗ Следующая страница не найдена")
         return False
     
-    def _go_to_next_page(self, current_page: int) -> bool:
-        """Переходит на следующую страницу результатов"""
+    def _go_to_next_page(self, current_page: int, stride: int = 1) -> bool:
+        """Переходит на страницу current_page + stride"""
         try:
             # Формируем URL следующей страницы
-            next_url = self._get_next_page_url(current_page)
-            self.logger.debug(f"Переход на: {next_url}")
+            next_url = self._get_next_page_url(current_page + stride)
+            self.logger.debug("Переход на: %s", next_url)
             
-            # Переходим на следующую страницу
+            # Переходим на следующую страницу и ждём появления карточек
+            # (явное ожидание возвращается сразу, как только DOM готов)
             self.driver.get(next_url)
-            time.sleep(self.config.timeouts.page_load_wait)
-            
-            # Ждем загрузки новых карточек
-            WebDriverWait(self.driver, self.config.timeouts.page_load_wait * 2).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, self.VACANCY_CARD_SELECTOR))
-            )
+            if self.helper.wait_for_any(
+                [self.VACANCY_CARD_SELECTOR],
+                timeout=self.config.timeouts.page_load_wait * 2,
+                stop_loading=self.config.aggressive_stop
+            ) is None:
+                raise TimeoutException("карточки не появились")
             
-            self.logger.debug(f"✓ Успешно перешли на страницу {current_page + 1}")
+            self.logger.debug("✓ Успешно перешли на страницу %s", current_page + stride)
             return True
             
         except (TimeoutException, Exception) as e:
-            self.logger.debug(f"✗ Не удалось перейти на следующую страницу: {e}")
+            self.logger.debug("✗ Не удалось перейти на следующую страницу: %s", e)
             return False
     
     def _process_search_query(self, query: dict) -> None:
@@ -303,70 +706,110 @@ class HHApplierBot:
             self.logger.warn(f"⚠ Пропуск запроса без URL: {name}")
             return
         
+        # Локальные ссылки на горячие атрибуты для внутреннего цикла
+        cfg = self.config
+        storage = self.storage
+        driver = self.driver
+
         print(f"\n🔍 Поиск: {name}")
-        self.driver.get(url)
-        
-        try:
-            WebDriverWait(self.driver, self.config.timeouts.page_load_wait).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, self.VACANCY_CARD_SELECTOR))
-            )
-        except TimeoutException:
+        driver.get(url)
+
+        if self.helper.wait_for_any(
+            [self.VACANCY_CARD_SELECTOR],
+            timeout=cfg.timeouts.page_load_wait,
+            stop_loading=cfg.aggressive_stop
+        ) is None:
             print("  ⚠ Нет вакансий или проблема с доступом")
             return
-        
+
+        # Разведочная HTTP-сессия создаётся после первой навигации —
+        # до неё get_cookies() рабочего драйвера возвращает пустоту
+        if self.http is None:
+            self._init_http_session()
+
         page_num = 1
-        max_pages = self.config.max_pages if hasattr(self.config, 'max_pages') else 5
+        max_pages = cfg.max_pages if hasattr(cfg, 'max_pages') else 5
+        # Число страниц известно из стора сразу — дальше проверка
+        # пагинации не требует ни одного обращения к DOM
+        total_pages = self._get_total_pages()
+        if total_pages is not None:
+            self.logger.debug("Страниц в выдаче: %s", total_pages)
         total_processed_in_query = 0
         total_skipped_in_query = 0
+        # Шаг перехода по страницам: растёт, пока попадаются страницы,
+        # целиком состоящие из уже известных вакансий
+        skip_stride = 1
+        # Подряд идущие страницы без единой новой вакансии: дальше почти
+        # наверняка только просмотренная история, запрос можно завершать
+        seen_page_streak = 0
         
         while page_num <= max_pages:
             print(f"\n  📄 Страница {page_num}/{max_pages}")
             
-            cards = self._get_vacancy_cards()
-            if not cards:
+            # Метаданные всех карточек одним вызовом JS,
+            # фильтрация — целиком в Python без обращений к Selenium
+            cards_meta = self._collect_card_metadata()
+            if not cards_meta:
                 print("  ⚠ Карточки не найдены")
                 break
-            
-            print(f"  📊 Вакансий на странице: {len(cards)}")
-            
+
+            print(f"  📊 Вакансий на странице: {len(cards_meta)}")
+
             page_processed = 0
             page_skipped = 0
             page_already_seen = 0
-            
-            for i in range(len(cards)):
+
+            # Один снимок известных id и одна точка отсчёта статистики
+            # на страницу вместо пары вызовов к storage на каждую карточку
+            known_ids = storage.known_ids()
+            prev_processed, prev_skipped = storage.get_stats()
+
+            for i, meta in enumerate(cards_meta):
+                vacancy_id = meta.get('id')
+                title = meta.get('title') or ''
+
+                # Уже известные вакансии отсеиваем без единого запроса к браузеру
+                if vacancy_id and vacancy_id in known_ids:
+                    page_already_seen += 1
+                    continue
+
+                # Фильтр по ключевым словам — локальная проверка строки
+                if vacancy_id and title and self._keyword_pattern:
+                    if not self._keyword_pattern.search(title):
+                        print(f"\n  📋 {title}")
+                        print("     ⊗ Пропуск: не подходит по ключевым словам")
+                        storage.mark_skipped(vacancy_id, title, "not_suitable_keywords")
+                        page_skipped += 1
+                        prev_skipped += 1
+                        continue
+
+                # Нет кнопки отклика — уже откликались
+                if vacancy_id and title and not meta.get('hasApply'):
+                    print(f"\n  📋 {title}")
+                    print("     ✓ Уже откликались ранее")
+                    storage.mark_processed(vacancy_id, title, "already_applied")
+                    page_processed += 1
+                    prev_processed += 1
+                    continue
+
+                # Карточка прошла фильтры — нужен живой элемент для клика
                 try:
                     cards = self._get_vacancy_cards()
                     if i >= len(cards):
                         break
-                    
-                    # Проверяем, была ли вакансия уже обработана
-                    card = cards[i]
-                    try:
-                        vacancy_id = card.get_attribute("data-vacancy-id") or card.get_attribute("id")
-                        if vacancy_id:
-                            vacancy_id = vacancy_id.replace("vacancy_", "")
-                            if self.storage.is_processed(vacancy_id) or self.storage.is_skipped(vacancy_id):
-                                page_already_seen += 1
-                                self._process_card(card)
-                                continue
-                    except:
-                        pass
-                    
-                    before_processed = self.storage.get_stats()[0]
-                    before_skipped = self.storage.get_stats()[1]
-                    
-                    self._process_card(cards[i])
-                    
-                    after_processed = self.storage.get_stats()[0]
-                    after_skipped = self.storage.get_stats()[1]
-                    
-                    if after_processed > before_processed:
+
+                    self._process_card(cards[i], meta)
+
+                    cur_processed, cur_skipped = storage.get_stats()
+
+                    if cur_processed > prev_processed:
                         page_processed += 1
-                    elif after_skipped > before_skipped:
+                    elif cur_skipped > prev_skipped:
                         page_skipped += 1
-                        
+                    prev_processed, prev_skipped = cur_processed, cur_skipped
+
                 except StaleElementReferenceException:
-                    self.logger.debug(f"⚠ Stale element at index {i}, пропускаем")
+                    self.logger.debug("⚠ Stale element at index %s, пропускаем", i)
                     continue
                 except Exception as e:
                     print(f"  ❌ Ошибка при обработке карточки {i}: {e}")
@@ -382,26 +825,71 @@ class HHApplierBot:
                     summary += f", уже обработано ранее {page_already_seen}"
                 print(summary)
             
-            # Убеждаемся, что мы на странице поиска
-            if 'search/vacancy' not in self.driver.current_url:
+            # Убеждаемся, что мы на странице поиска: возврат ждёт по URL,
+            # отдельная пауза «на стабилизацию» не нужна — переход на
+            # следующую страницу сам ждёт появления карточек
+            if 'search/vacancy' not in driver.current_url:
                 self.logger.debug("⚠ Не на странице поиска, возвращаемся...")
-                self.driver.back()
-                time.sleep(1)
-            
-            # Ждём, чтобы страница стабилизировалась
-            time.sleep(0.5)
-            
+                self._back_to_search()
+
+            # Страница целиком из уже известных вакансий — ускоряем шаг,
+            # чтобы не перечитывать просмотренную историю по одной странице
+            if page_already_seen == len(cards_meta):
+                skip_stride = min(skip_stride * 2, 4)
+                seen_page_streak += 1
+            else:
+                skip_stride = 1
+                seen_page_streak = 0
+
+            if seen_page_streak >= 2:
+                print(f"\n  ✓ Две страницы подряд без новых вакансий — завершаем запрос")
+                break
+
+            stride = min(skip_stride, max_pages - page_num) if page_num < max_pages else 0
+
+            # HTTP-разведка: дешёвым GET выясняем, есть ли на следующих
+            # страницах новые вакансии, и не рендерим их зря в Chrome.
+            # Пустой список id — не доказательство конца выдачи (антибот-
+            # заглушка или изменившаяся разметка тоже отдаются с 200),
+            # поэтому такую страницу отдаём Chrome на подтверждение
+            if stride > 0 and self.http is not None:
+                while page_num + stride <= max_pages:
+                    page_ids = self._fetch_page_ids(page_num + stride)
+                    if not page_ids:
+                        break
+                    if any(not storage.is_known(vid) for vid in page_ids):
+                        break
+                    print(f"  ⏩ Страница {page_num + stride}: новых вакансий нет (HTTP), пропускаем")
+                    stride += 1
+                if page_num + stride > max_pages:
+                    stride = 0
+
             # Переходим на следующую страницу
-            if page_num < max_pages:
-                # Проверяем наличие следующей страницы
-                has_next = self._has_next_page(page_num)
-                
+            if stride > 0:
+                # Проверяем наличие целевой страницы: по счётчику из
+                # стора, если он прочитался, иначе по DOM-пагинатору
+                if total_pages is not None:
+                    has_next = page_num + stride <= total_pages
+                else:
+                    has_next = self._has_next_page(page_num, stride)
+
+                # Перескок вышел за последнюю страницу — пробуем обычный шаг
+                if not has_next and stride > 1:
+                    stride = 1
+                    if total_pages is not None:
+                        has_next = page_num + stride <= total_pages
+                    else:
+                        has_next = self._has_next_page(page_num, stride)
+
                 if has_next:
-                    print(f"\n  ➡️  Переход на страницу {page_num + 1}...")
-                    if not self._go_to_next_page(page_num):
+                    if stride > 1:
+                        print(f"\n  ⏩ Страницы уже просмотрены, перескакиваем на {page_num + stride}...")
+                    else:
+                        print(f"\n  ➡️  Переход на страницу {page_num + 1}...")
+                    if not self._go_to_next_page(page_num, stride):
                         print("  ⚠ Не удалось перейти на следующую страницу (технический сбой)")
                         break
-                    page_num += 1
+                    page_num += stride
                 else:
                     if page_num == 1:
                         print(f"\n  💡 По этому запросу всего 1 страница результатов")
@@ -426,32 +914,39 @@ class HHApplierBot:
         print("=" * 60)
         print("⚙️  Настройка Chrome WebDriver...")
         
-        try:
-            self.driver = self._create_driver()
-        except Exception as e:
-            print(f"❌ Ошибка запуска Chrome: {e}")
-            return
-        
-        print("✅ Chrome WebDriver запущен")
-        
-        self.helper = SeleniumHelper(self.driver)
-        self.modal = ApplicationModal(self.driver, self.helper, self.config.timeouts)
+        attached = self._try_attach_session()
+        if attached is not None:
+            self.driver = attached
+            print("✅ Переподключились к запущенному Chrome")
+        else:
+            try:
+                self.driver = self._create_driver()
+            except Exception as e:
+                print(f"❌ Ошибка запуска Chrome: {e}")
+                return
+
+            print("✅ Chrome WebDriver запущен")
+
+        self._setup_session(self.driver)
         self.storage = VacancyStorage(
             self.config.processed_file,
             self.config.skipped_file,
-            self.config.save_interval
+            self.config.save_interval,
+            max_entries=self.config.max_history_entries
         )
         
         try:
             print("🌐 Открываем hh.ru...")
             self.driver.get("https://hh.ru/")
-            time.sleep(self.config.timeouts.page_load_wait)
+            self.helper.wait_for_any(self.AUTH_SELECTORS, timeout=self.config.timeouts.page_load_wait)
             
             if not self._is_logged_in():
                 if not self._wait_for_login():
                     return
             else:
                 print("🔓 Уже авторизован")
+
+            self._init_http_session()
             
             processed, skipped = self.storage.get_stats()
             print(f"\n📊 Статистика:")
@@ -463,15 +958,25 @@ class HHApplierBot:
             print(f"📄 Страниц на запрос: до {self.config.max_pages}")
             print(f"⚠️  Для остановки нажми Ctrl+C\n")
             
+            executor = None
+            if self.config.max_concurrency > 1:
+                print(f"⚡ Параллельных потоков: {self.config.max_concurrency}")
+                executor = ThreadPoolExecutor(max_workers=self.config.max_concurrency)
+
             cycle_num = 1
             while True:
                 print(f"\n{'=' * 60}")
                 print(f"🔄 ЦИКЛ #{cycle_num}")
                 print(f"{'=' * 60}")
-                
-                for query in self.config.search_queries:
-                    self._process_search_query(query)
-                    self.storage.save(force=True)
+
+                if executor is not None:
+                    # Каждый поток работает в своём окне Chrome,
+                    # хранилище защищено блокировкой
+                    list(executor.map(self._worker_process_query, self.config.search_queries))
+                else:
+                    for query in self.config.search_queries:
+                        self._process_search_query(query)
+                        self.storage.save(force=True)
                 
                 print("\n" + "=" * 60)
                 processed, skipped = self.storage.get_stats()
@@ -496,5 +1001,16 @@ class HHApplierBot:
             print(f"   ⊗ Пропущено: {skipped}")
         finally:
             self.storage.save(force=True)
-            self.driver.quit()
-            print("👋 Chrome закрыт. До встречи!")
+            with self._worker_drivers_lock:
+                for worker_driver in self._worker_drivers:
+                    try:
+                        worker_driver.quit()
+                    except Exception:
+                        pass
+            if self.config.reuse_session:
+                self._save_session()
+                self._detach_service()
+                print("👋 Chrome оставлен открытым для следующего запуска. До встречи!")
+            else:
+                self.driver.quit()
+                print("👋 Chrome закрыт. До встречи!")
@@ -2,36 +2,58 @@
 Загрузка и валидация конфигурации
 """
 
+import hashlib
 import os
 import sys
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from pathlib import Path
 from typing import Dict, List, Any, Optional
-from urllib.parse import quote_plus
 
-try:
-    import yaml
-except ImportError:
-    yaml = None
 
+def _import_yaml():
+    """Лениво импортирует PyYAML вместе с самым быстрым загрузчиком.
 
-@dataclass
+    Модуль config импортируется при каждом старте, а PyYAML нужен
+    только когда реально читается config.yaml — держим его вне
+    top-level импортов. Загрузчик на C (libyaml) разбирает конфиг
+    на порядок быстрее чистопитоновского.
+    """
+    try:
+        import yaml
+    except ImportError:
+        return None, None
+    try:
+        from yaml import CSafeLoader as loader
+    except ImportError:
+        from yaml import SafeLoader as loader
+    return yaml, loader
+
+
+@dataclass(slots=True)
 class TimeoutConfig:
     """Конфигурация таймаутов"""
-    implicit_wait: float = 0.3
+    # 0 = промахи find_element возвращаются сразу; ожидание — только
+    # явными WebDriverWait в местах, где оно действительно нужно
+    implicit_wait: float = 0.0
     modal_wait: float = 1.0
     element_wait: float = 0.5
     page_load_wait: float = 2.0
 
 
-@dataclass 
+@dataclass(slots=True)
 class ResumeRule:
     """Правило выбора резюме"""
     title: str
     keywords: List[str]
+    # Ключевые слова в нижнем регистре, посчитанные один раз при
+    # загрузке конфига — pick_resume зовётся на каждую вакансию
+    keywords_lower: tuple = field(init=False, repr=False, default=())
 
+    def __post_init__(self):
+        self.keywords_lower = tuple(kw.lower() for kw in self.keywords)
 
-@dataclass
+
+@dataclass(slots=True)
 class Config:
     """Главная конфигурация бота"""
     
@@ -55,6 +77,13 @@ class Config:
     # Настройки бота
     debug: bool = False
     save_interval: int = 10
+    # Сколько записей истории держать в памяти с полными метаданными
+    # (0 = без ограничения). Id всех вакансий остаются в памяти всегда —
+    # лимит не приводит к повторным откликам
+    max_history_entries: int = 0
+    # Параллельная обработка поисковых запросов (количество окон Chrome).
+    # Больше 3-5 не рекомендуется — hh.ru может ограничить частоту запросов.
+    max_concurrency: int = 1
     
     # Таймауты
     timeouts: TimeoutConfig = field(default_factory=TimeoutConfig)
@@ -68,65 +97,161 @@ class Config:
     
     # Настройки Chrome
     chrome_profile: str = "chrome_profile"
+    # Держать копию профиля в tmpfs (/dev/shm) для быстрого старта Chrome;
+    # изменения синхронизируются обратно на диск при выходе
+    chrome_profile_tmpfs: bool = False
     profile_name: str = "HH_Bot"
     chromedriver_path: str = ""
     headless: bool = False
+    # Стратегия загрузки страниц: 'eager' не ждёт картинки/трекеры/шрифты
+    page_load_strategy: str = "eager"
+    load_images: bool = False
+    # Не закрывать Chrome при выходе и переподключаться к нему при
+    # следующем запуске (экономит 1-2 секунды холодного старта)
+    reuse_session: bool = False
+    # Обрывать догрузку страницы (window.stop) после появления карточек
+    aggressive_stop: bool = True
+    # Лёгкая HTTP-разведка страниц поиска (requests вместо рендера в Chrome)
+    # для пропуска страниц без новых вакансий
+    http_prefilter: bool = True
+    # Шаблоны URL, блокируемые на сетевом уровне (реклама/аналитика)
+    blocked_url_patterns: List[str] = field(default_factory=lambda: [
+        "*.doubleclick.net/*",
+        "*.google-analytics.com/*",
+        "*googletagmanager*",
+        "*mc.yandex.*",
+        "*.criteo.*",
+        "*.adriver.*",
+        "*.facebook.com/tr*",
+        "*.mail.ru/counter*",
+    ])
     
-    # Задержки
-    page_load_delay: float = 2.0
-    delay_between_pages: float = 3.0
+    # Задержка между откликами (загрузку страниц заменили явные
+    # ожидания, отдельных задержек для неё больше нет)
     delay_between_applies: float = 2.0
     
+    def pick_resume(self, vacancy_title: str) -> Optional[str]:
+        """Возвращает название резюме, подходящего под заголовок вакансии.
+
+        Применяется первое совпавшее правило (порядок правил важен).
+        """
+        lower_title = vacancy_title.lower()
+        for rule in self.resume_rules:
+            if any(kw in lower_title for kw in rule.keywords_lower):
+                return rule.title
+        return None
+
     @staticmethod
-    def load(config_path: Optional[str] = None) -> 'Config':
+    def load(config_path: Optional[str] = None,
+             bypass_validators: bool = False) -> 'Config':
         """
         Загружает конфигурацию из YAML файла.
         Если файл не найден, возвращает конфигурацию по умолчанию.
+
+        bypass_validators=True пропускает нормализацию поисковых
+        запросов — для уже каноничного YAML (повторные загрузки,
+        тесты) это экономит проход по всем полям.
         """
-        return load_config(config_path)
+        return load_config(config_path, bypass_validators=bypass_validators)
+
 
+# Результат поиска config.yaml по умолчанию: False — ещё не искали,
+# None — не найден, str — найденный путь. Избавляет повторные
+# Config.load() от stat-проб файловой системы
+_DEFAULT_CONFIG_PATH = False
 
-def load_config(config_path: Optional[str] = None) -> Config:
+
+def load_config(config_path: Optional[str] = None,
+                bypass_validators: bool = False) -> Config:
     """
     Загружает конфигурацию из YAML файла.
     Если файл не найден, возвращает конфигурацию по умолчанию.
     """
+    global _DEFAULT_CONFIG_PATH
+
     if config_path is None:
-        # Ищем config.yaml в текущей директории или рядом со скриптом
-        possible_paths = [
-            Path("config.yaml"),
-            Path(__file__).parent.parent / "config.yaml",
-        ]
-        
-        for path in possible_paths:
-            if path.exists():
-                config_path = str(path)
-                break
-    
+        if _DEFAULT_CONFIG_PATH is False:
+            # Ищем config.yaml в текущей директории или рядом со скриптом
+            possible_paths = [
+                Path("config.yaml"),
+                Path(__file__).parent.parent / "config.yaml",
+            ]
+
+            _DEFAULT_CONFIG_PATH = None
+            for path in possible_paths:
+                if path.exists():
+                    _DEFAULT_CONFIG_PATH = str(path)
+                    break
+        config_path = _DEFAULT_CONFIG_PATH
+
     if config_path and os.path.exists(config_path):
-        return _load_from_yaml(config_path)
-    
+        return _load_from_yaml(config_path, bypass_validators=bypass_validators)
+
     print("[WARN] config.yaml не найден, используем настройки по умолчанию")
     print("[HINT] Скопируйте config.example.yaml в config.yaml и настройте")
     return Config()
 
 
-def _load_from_yaml(path: str) -> Config:
+# Кэш разобранных конфигов: (абсолютный путь, режим загрузки) →
+# (mtime, Config). Повторные Config.load() того же неизменённого файла
+# не трогают PyYAML. Режим в ключе обязателен: конфиги, загруженные
+# с bypass_validators и без, — разные объекты
+_YAML_CACHE: Dict[tuple, tuple] = {}
+
+# Второй слой: хэш содержимого → Config. Ловит одинаковый YAML под
+# разными путями или с изменившимся mtime (copy, touch)
+_PARSED_CACHE: Dict[tuple, Config] = {}
+
+
+def clear_config_cache() -> None:
+    """Сбрасывает кэш загруженных конфигов (тесты, горячая перезагрузка)"""
+    global _DEFAULT_CONFIG_PATH
+    _YAML_CACHE.clear()
+    _PARSED_CACHE.clear()
+    _DEFAULT_CONFIG_PATH = False
+
+
+def _load_from_yaml(path: str, bypass_validators: bool = False) -> Config:
     """Загружает конфигурацию из YAML файла"""
+    yaml, yaml_loader = _import_yaml()
     if yaml is None:
         print("[ERROR] PyYAML не установлен. Выполните: pip install pyyaml")
         sys.exit(1)
-    
+
+    abs_path = os.path.abspath(path)
+    try:
+        mtime = os.path.getmtime(abs_path)
+    except OSError:
+        mtime = None
+
+    yaml_key = (abs_path, bypass_validators)
+    if mtime is not None:
+        cached = _YAML_CACHE.get(yaml_key)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
     with open(path, 'r', encoding='utf-8') as f:
-        data = yaml.safe_load(f)
+        data = yaml.load(f, Loader=yaml_loader)
     
     if not data:
         return Config()
-    
+
+    # Ключ по содержимому (и режиму загрузки): повторная сборка Config
+    # из идентичных данных не нужна
+    content_key = (
+        bypass_validators,
+        hashlib.blake2b(repr(data).encode(), digest_size=16).digest(),
+    )
+    cached_config = _PARSED_CACHE.get(content_key)
+    if cached_config is not None:
+        if mtime is not None:
+            _YAML_CACHE[yaml_key] = (mtime, cached_config)
+        return cached_config
+
     # Парсим таймауты
     timeouts_data = data.get('timeouts', {})
     timeouts = TimeoutConfig(
-        implicit_wait=timeouts_data.get('implicit_wait', 0.3),
+        implicit_wait=timeouts_data.get('implicit_wait', 0.0),
         modal_wait=timeouts_data.get('modal_wait', 1.0),
         element_wait=timeouts_data.get('element_wait', 0.5),
         page_load_wait=timeouts_data.get('page_load_wait', 2.0),
@@ -141,45 +266,53 @@ def _load_from_yaml(path: str) -> Config:
         ))
     
     # Парсим поисковые запросы
-    search_queries = []
     raw_queries = data.get('search_queries', [])
     allowed_keywords = data.get('allowed_keywords', [])
     area = data.get('area', 113)
     schedule = data.get('schedule', 'remote')
-    
-    for query in raw_queries:
-        if isinstance(query, dict):
-            # Новый формат: {'url': '...', 'keywords': [...], 'name': '...'}
-            search_queries.append(query)
-        elif isinstance(query, str):
-            # Старый формат: просто строка запроса
-            # Конвертируем в URL
-            url = f"https://hh.ru/search/vacancy?text={quote_plus(query)}&area={area}&schedule={schedule}"
-            search_queries.append({
-                'url': url,
-                'keywords': allowed_keywords,
-                'name': query,
-            })
-    
-    return Config(
-        search_queries=search_queries,
-        allowed_keywords=allowed_keywords,
-        resume_rules=resume_rules,
-        cover_letter=data.get('cover_letter', ''),
-        area=area,
-        schedule=schedule,
-        max_pages=data.get('max_pages', 5),
-        debug=data.get('debug', False),
-        save_interval=data.get('save_interval', 10),
-        timeouts=timeouts,
-        chrome_profile=data.get('chrome_profile', 'chrome_profile'),
-        profile_name=data.get('profile_name', 'HH_Bot'),
-        chromedriver_path=data.get('chromedriver_path', ''),
-        headless=data.get('headless', False),
-        page_load_delay=data.get('page_load_delay', 2.0),
-        delay_between_pages=data.get('delay_between_pages', 3.0),
-        delay_between_applies=data.get('delay_between_applies', 2.0),
-    )
+
+    if bypass_validators:
+        # Доверяем каноничному YAML: запросы уже в формате словарей
+        search_queries = raw_queries
+    else:
+        search_queries = []
+        for query in raw_queries:
+            if isinstance(query, dict):
+                # Новый формат: {'url': '...', 'keywords': [...], 'name': '...'}
+                search_queries.append(query)
+            elif isinstance(query, str):
+                # Старый формат: просто строка запроса
+                # Конвертируем в URL (импорт локальный — нужен только здесь)
+                from urllib.parse import quote_plus
+                url = f"https://hh.ru/search/vacancy?text={quote_plus(query)}&area={area}&schedule={schedule}"
+                search_queries.append({
+                    'url': url,
+                    'keywords': allowed_keywords,
+                    'name': query,
+                })
+
+    # Поля, собранные выше с нормализацией; остальные скалярные поля
+    # берём одним проходом по fields(Config) — только присутствующие
+    # в YAML ключи, дефолты дают сами объявления dataclass
+    prepared = {
+        'search_queries': search_queries,
+        'allowed_keywords': allowed_keywords,
+        'resume_rules': resume_rules,
+        'timeouts': timeouts,
+        'area': area,
+        'schedule': schedule,
+    }
+    kwargs = {
+        f.name: data[f.name]
+        for f in fields(Config)
+        if f.name in data and f.name not in prepared
+    }
+    config = Config(**prepared, **kwargs)
+
+    _PARSED_CACHE[content_key] = config
+    if mtime is not None:
+        _YAML_CACHE[yaml_key] = (mtime, config)
+    return config
 
 
 def get_resume_rules_as_dicts(config: Config) -> List[Dict[str, Any]]:
@@ -2,12 +2,15 @@
 Логирование для HH Auto Applier
 """
 
+import sys
 from typing import Optional
 
 
 class Logger:
     """Простой логгер с поддержкой режима отладки и цветного вывода"""
-    
+
+    __slots__ = ('debug_mode', 'use_colors', '_suffix', '_prefix')
+
     # ANSI цвета для терминала
     COLORS = {
         'reset': '\033[0m',
@@ -20,49 +23,77 @@ class Logger:
         'gray': '\033[90m',
     }
     
+    # Цвет и тег каждого уровня: префиксы собираются один раз в __init__
+    LEVELS = {
+        'debug': ('gray', '[DEBUG]'),
+        'info': ('blue', '[INFO]'),
+        'success': ('green', '[OK]'),
+        'warn': ('yellow', '[WARN]'),
+        'error': ('red', '[ERROR]'),
+        'card': ('cyan', '[CARD]'),
+        'search': ('magenta', '[SEARCH]'),
+    }
+
     def __init__(self, debug_mode: bool = False, use_colors: bool = True):
         self.debug_mode = debug_mode
         self.use_colors = use_colors
-    
+        # Готовые префиксы вида '\033[90m[DEBUG] ' — ни f-строк,
+        # ни поиска цвета в словаре на каждый вызов
+        self._suffix = self.COLORS['reset'] if use_colors else ''
+        self._prefix = {
+            level: (self.COLORS[color] if use_colors else '') + tag + ' '
+            for level, (color, tag) in self.LEVELS.items()
+        }
+
     def _colorize(self, text: str, color: str) -> str:
         """Добавляет цвет к тексту"""
         if not self.use_colors:
             return text
         return f"{self.COLORS.get(color, '')}{text}{self.COLORS['reset']}"
-    
-    def debug(self, message: str) -> None:
-        """Выводит сообщение только в режиме отладки"""
-        if self.debug_mode:
-            print(self._colorize(f"[DEBUG] {message}", 'gray'))
-    
+
+    def debug(self, message: str, *args) -> None:
+        """Выводит сообщение только в режиме отладки.
+
+        Поддерживает ленивое %-форматирование: logger.debug("x=%s", x)
+        не тратит время на подстановку, когда отладка выключена.
+        """
+        if not self.debug_mode:
+            return
+        if args:
+            message = message % args
+        sys.stdout.write(self._prefix['debug'] + message + self._suffix + '\n')
+
     def info(self, message: str) -> None:
         """Выводит информационное сообщение"""
-        print(self._colorize(f"[INFO] {message}", 'blue'))
-    
+        sys.stdout.write(self._prefix['info'] + message + self._suffix + '\n')
+
     def success(self, message: str) -> None:
         """Выводит сообщение об успехе"""
-        print(self._colorize(f"[OK] {message}", 'green'))
-    
+        sys.stdout.write(self._prefix['success'] + message + self._suffix + '\n')
+        sys.stdout.flush()
+
     def warn(self, message: str) -> None:
         """Выводит предупреждение"""
-        print(self._colorize(f"[WARN] {message}", 'yellow'))
-    
+        sys.stdout.write(self._prefix['warn'] + message + self._suffix + '\n')
+        sys.stdout.flush()
+
     def error(self, message: str) -> None:
         """Выводит сообщение об ошибке"""
-        print(self._colorize(f"[ERROR] {message}", 'red'))
-    
+        sys.stdout.write(self._prefix['error'] + message + self._suffix + '\n')
+        sys.stdout.flush()
+
     def card(self, message: str) -> None:
         """Выводит информацию о карточке вакансии"""
-        print(self._colorize(f"[CARD] {message}", 'cyan'))
-    
+        sys.stdout.write(self._prefix['card'] + message + self._suffix + '\n')
+
     def search(self, message: str) -> None:
         """Выводит информацию о поиске"""
-        print(self._colorize(f"[SEARCH] {message}", 'magenta'))
+        sys.stdout.write(self._prefix['search'] + message + self._suffix + '\n')
     
     def divider(self, char: str = "=", length: int = 60) -> None:
         """Выводит разделитель"""
         if self.debug_mode:
-            print(char * length)
+            sys.stdout.write(char * length + '\n')
 
 
 # Глобальный экземпляр логгера (будет настроен при загрузке конфига)
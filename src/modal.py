@@ -3,43 +3,51 @@
 Адаптировано из main_refactored.py
 """
 
-import time
-from typing import List, Any
+from typing import Optional
 
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import (
-    NoSuchElementException,
-    TimeoutException
-)
+from selenium.common.exceptions import TimeoutException
+
+from .logger import get_logger
 
 
 class ApplicationModal:
     """Управление модальным окном отклика"""
-    
+
+    __slots__ = ('driver', 'helper', 'timeouts',
+                 'modal_wait', 'element_wait', '_log')
+
     MODAL_SELECTORS = [
         "[data-qa*='vacancy-response']",
         "[data-qa*='vacancy-response-modal']",
     ]
-    
+
     CLOSE_BUTTON_SELECTORS = [
         "[data-qa='vacancy-response-modal-close']",
         "button[aria-label='Закрыть']",
     ]
-    
+
     SUBMIT_BUTTON_SELECTORS = [
         "[data-qa='vacancy-response-link-no-questions']",
         "button[data-qa='vacancy-response-submit-popup']",
         "[data-qa='vacancy-response-submit-button']",
         "button[data-qa*='submit']",
     ]
-    
+
     RESUME_SELECTORS = [
         "[data-qa='resume-select-item']",
         "[data-qa='resume-select'] div[data-qa='resume-title']",
         "div[data-qa='resume-title']",
     ]
+
+    # Объединённые CSS-группы: один запрос к браузеру вместо
+    # перебора селекторов по одному
+    MODAL_CSS = ", ".join(MODAL_SELECTORS)
+    CLOSE_BUTTON_CSS = ", ".join(CLOSE_BUTTON_SELECTORS)
+    SUBMIT_BUTTON_CSS = ", ".join(SUBMIT_BUTTON_SELECTORS)
+    RESUME_CSS = ", ".join(RESUME_SELECTORS)
     
     COVER_LETTER_TEXTAREA = "textarea[data-qa='vacancy-response-popup-form-letter-input']"
     
@@ -47,6 +55,8 @@ class ApplicationModal:
         self.driver = driver
         self.helper = helper
         self.timeouts = timeouts
+        # Логгер один раз в атрибут: без global-lookup в горячих методах
+        self._log = get_logger()
         self.modal_wait = 1.0
         self.element_wait = 0.5
         if timeouts:
@@ -58,25 +68,31 @@ class ApplicationModal:
         try:
             original_url = self.driver.current_url
             self.helper.safe_click(button)
-            
-            time.sleep(0.3)
-            if self.driver.current_url != original_url:
+
+            # Ждём первое из двух событий: появилась модалка или
+            # произошёл редирект (обязательный тест) — без слепого sleep
+            try:
+                WebDriverWait(self.driver, self.modal_wait, poll_frequency=0.1).until(
+                    lambda d: d.current_url != original_url
+                    or d.find_elements(By.CSS_SELECTOR, self.MODAL_CSS)
+                )
+            except TimeoutException:
+                self._log.debug("Модалка не появилась за %.1fс", self.modal_wait)
                 return False
-            
-            self.helper.wait_for_element("[data-qa*='vacancy-response']", self.modal_wait)
-            return True
+
+            return self.driver.current_url == original_url
         except TimeoutException:
             return False
     
+    def is_open(self) -> bool:
+        """Проверяет, открыто ли модальное окно (один запрос к браузеру)"""
+        return bool(self.helper.find_elements_safe(self.MODAL_CSS))
+
     def close(self) -> None:
         """Закрывает модальное окно"""
-        for selector in self.CLOSE_BUTTON_SELECTORS:
-            try:
-                close_btn = self.driver.find_element(By.CSS_SELECTOR, selector)
-                self.helper.safe_click(close_btn)
-                return
-            except NoSuchElementException:
-                continue
+        buttons = self.driver.find_elements(By.CSS_SELECTOR, self.CLOSE_BUTTON_CSS)
+        if buttons:
+            self.helper.safe_click(buttons[0])
     
     def has_mandatory_test(self) -> bool:
         """Проверяет наличие обязательного теста"""
@@ -84,110 +100,114 @@ class ApplicationModal:
         if 'startedWithQuestion=true' in url or 'vacancy_response' in url:
             return True
         
-        try:
-            self.driver.find_element(
-                By.CSS_SELECTOR, 
-                "[data-qa='vacancy-response-link-no-questions']"
-            )
-            return False
-        except NoSuchElementException:
-            pass
-        
+        # Старый поиск кнопки «без вопросов» не влиял на результат
+        # (обе ветки возвращали False) — лишний round-trip убран
         return False
     
-    def choose_resume(self, vacancy_title: str, resume_rules: List[Any]) -> None:
-        """Выбирает подходящее резюме"""
-        lower_title = vacancy_title.lower()
-        
-        matched_rule = None
-        for rule in resume_rules:
-            if hasattr(rule, 'keywords'):
-                keywords = rule.keywords
-                title_substring = rule.title
-            else:
-                keywords = rule.get("match_keywords", rule.get("keywords", []))
-                title_substring = rule.get("title_substring", rule.get("title", ""))
-            
-            if any(kw.lower() in lower_title for kw in keywords):
-                matched_rule = {"title_substring": title_substring, "keywords": keywords}
-                break
-        
-        if not matched_rule:
+    def choose_resume(self, resume_title: Optional[str]) -> None:
+        """Выбирает в форме резюме с указанным названием.
+
+        Решение, какое резюме подходит вакансии, принимает
+        Config.pick_resume — здесь только работа с UI.
+        """
+        if not resume_title:
             return
-        
-        target_substring = matched_rule["title_substring"].lower()
-        
+
+        target_substring = resume_title.lower()
+
         self._open_resume_dropdown()
-        
+
+        if self.helper.wait_for_element(
+            "div[data-qa='resume-title']", self.element_wait
+        ) is None:
+            return
+
+        # Тексты всех блоков резюме одним вызовом JS вместо пары
+        # round-trip'ов (find_element + .text) на каждый блок
         try:
-            resume_titles = WebDriverWait(self.driver, self.element_wait).until(
-                EC.presence_of_all_elements_located(
-                    (By.CSS_SELECTOR, "div[data-qa='resume-title']")
-                )
-            )
-        except TimeoutException:
+            titles = self.driver.execute_script("""
+                return Array.from(
+                    document.querySelectorAll("div[data-qa='resume-title']")
+                ).map(function(el) {
+                    const cell = el.querySelector("div[data-qa='cell-text-content']");
+                    return ((cell || el).innerText || '').trim();
+                });
+            """) or []
+        except Exception:
+            titles = []
+
+        if not titles:
             return
-        
+
         search_keywords = target_substring.replace("-", " ").replace("--", " ").split()
-        
-        for block in resume_titles:
-            try:
-                text = ""
-                try:
-                    text_el = block.find_element(
-                        By.CSS_SELECTOR, "div[data-qa='cell-text-content']"
-                    )
-                    text = text_el.text.strip()
-                except NoSuchElementException:
-                    text = block.text.strip()
-                
-                if not text:
-                    continue
-                
-                text_lower = text.lower()
-                
-                if target_substring in text_lower:
-                    self.helper.safe_click(block)
-                    return
-                
-                if all(kw in text_lower for kw in search_keywords if len(kw) > 2):
-                    self.helper.safe_click(block)
-                    return
-                    
-            except Exception:
+
+        chosen = None
+        for index, text in enumerate(titles):
+            text_lower = text.lower()
+            if not text_lower:
                 continue
-        
-        if len(resume_titles) == 1:
-            self.helper.safe_click(resume_titles[0])
+            if target_substring in text_lower:
+                chosen = index
+                break
+            if all(kw in text_lower for kw in search_keywords if len(kw) > 2):
+                chosen = index
+                break
+
+        if chosen is None and len(titles) == 1:
+            chosen = 0
+        if chosen is None:
+            self._log.debug("Резюме '%s' не найдено среди %s вариантов",
+                            resume_title, len(titles))
+            return
+
+        blocks = self.driver.find_elements(
+            By.CSS_SELECTOR, "div[data-qa='resume-title']"
+        )
+        if chosen < len(blocks):
+            self.helper.safe_click(blocks[chosen])
     
     def _open_resume_dropdown(self) -> None:
         """Открывает дропдаун с резюме"""
         try:
-            resume_items = self.driver.find_elements(By.CSS_SELECTOR, "div[data-qa='resume-title']")
-            visible_count = sum(1 for item in resume_items if item.is_displayed())
+            # Число видимых блоков резюме одним вызовом JS вместо
+            # is_displayed() на каждый элемент
+            visible_count = self.driver.execute_script(
+                "return Array.from("
+                "document.querySelectorAll(\"div[data-qa='resume-title']\")"
+                ").filter(e => e.offsetParent !== null).length;"
+            )
             if visible_count > 1:
                 return
             
-            current_resume = WebDriverWait(self.driver, self.element_wait).until(
-                EC.element_to_be_clickable((
-                    By.CSS_SELECTOR,
-                    ", ".join(self.RESUME_SELECTORS)
-                ))
+            current_resume = WebDriverWait(self.driver, self.element_wait,
+                                           poll_frequency=0.1).until(
+                EC.element_to_be_clickable((By.CSS_SELECTOR, self.RESUME_CSS))
             )
             self.helper.safe_click(current_resume)
-            time.sleep(0.2)
+            # Ждём раскрытия списка, а не фиксированные 200мс
+            WebDriverWait(self.driver, self.element_wait, poll_frequency=0.1).until(
+                lambda d: d.execute_script(
+                    "return Array.from("
+                    "document.querySelectorAll(\"div[data-qa='resume-title']\")"
+                    ").filter(e => e.offsetParent !== null).length;"
+                ) > 1
+            )
         except (TimeoutException, Exception):
             pass
     
     def is_cover_letter_required(self) -> bool:
-        """Проверяет, обязательно ли сопроводительное письмо"""
+        """Проверяет, обязательно ли сопроводительное письмо.
+
+        Поиск по innerText одним вызовом JS: дизъюнктивный XPath с
+        contains() обходил весь документ и был самым медленным
+        запросом модалки.
+        """
         try:
-            self.driver.find_element(
-                By.XPATH,
-                "//*[contains(text(),'обязательн') or contains(text(),'required')]"
-            )
-            return True
-        except NoSuchElementException:
+            return bool(self.driver.execute_script(
+                "const t = document.body.innerText;"
+                "return t.includes('обязательн') || t.includes('required');"
+            ))
+        except Exception:
             return False
     
     def add_cover_letter(self, text: str) -> bool:
@@ -209,77 +229,79 @@ class ApplicationModal:
             return False
     
     def _find_cover_letter_textarea(self):
-        """Ищет textarea для сопроводительного письма"""
-        try:
-            textarea = self.driver.find_element(By.CSS_SELECTOR, self.COVER_LETTER_TEXTAREA)
-            if textarea.is_displayed():
-                return textarea
-        except NoSuchElementException:
-            pass
-        
-        toggle_selectors = ["[data-qa='add-cover-letter']"]
-        
-        for selector in toggle_selectors:
-            try:
-                toggle = self.driver.find_element(By.CSS_SELECTOR, selector)
-                if toggle.is_displayed():
-                    self.helper.safe_click(toggle)
-                    break
-            except NoSuchElementException:
-                continue
-        
-        try:
-            toggle = self.driver.find_element(
+        """Ищет textarea для сопроводительного письма.
+
+        Все поиски идут через find_elements: промах — пустой список,
+        без исключений и их накладных расходов.
+        """
+        textareas = self.driver.find_elements(
+            By.CSS_SELECTOR, self.COVER_LETTER_TEXTAREA
+        )
+        if textareas and textareas[0].is_displayed():
+            return textareas[0]
+
+        toggles = self.driver.find_elements(
+            By.CSS_SELECTOR, "[data-qa='add-cover-letter']"
+        )
+        toggle = next((t for t in toggles if t.is_displayed()), None)
+        if toggle is not None:
+            self.helper.safe_click(toggle)
+        else:
+            text_toggles = self.driver.find_elements(
                 By.XPATH, "//*[contains(text(), 'Добавить сопроводительное')]"
             )
-            if toggle.is_displayed():
-                self.helper.safe_click(toggle)
-        except NoSuchElementException:
-            pass
-        
-        try:
-            return self.driver.find_element(By.CSS_SELECTOR, self.COVER_LETTER_TEXTAREA)
-        except NoSuchElementException:
-            textareas = self.helper.find_elements_safe("textarea")
-            for ta in textareas:
-                if ta.is_displayed():
-                    return ta
-        
+            text_toggle = next((t for t in text_toggles if t.is_displayed()), None)
+            if text_toggle is not None:
+                self.helper.safe_click(text_toggle)
+
+        textareas = self.driver.find_elements(
+            By.CSS_SELECTOR, self.COVER_LETTER_TEXTAREA
+        )
+        if textareas:
+            return textareas[0]
+
+        for ta in self.helper.find_elements_safe("textarea"):
+            if ta.is_displayed():
+                return ta
+
         return None
     
     def submit(self) -> bool:
         """Отправляет отклик"""
         current_url = self.driver.current_url
         
-        modal = self.helper.find_element_safe(
-            "[data-qa*='vacancy-response'], [data-qa*='vacancy-response-modal']",
-            timeout=0.3
-        )
-        
-        btn = None
-        for selector in self.SUBMIT_BUTTON_SELECTORS:
-            try:
-                found_btn = self.driver.find_element(By.CSS_SELECTOR, selector)
-                if found_btn.is_displayed():
-                    btn = found_btn
-                    break
-            except NoSuchElementException:
-                continue
+        modal = self.helper.find_element_safe(self.MODAL_CSS, timeout=0.3)
         
+        # Один запрос по объединённой группе селекторов; промахи
+        # возвращают пустой список вместо исключения
+        candidates = self.driver.find_elements(
+            By.CSS_SELECTOR, self.SUBMIT_BUTTON_CSS
+        )
+        btn = next((e for e in candidates if e.is_displayed()), None)
+
         if btn is None:
-            try:
-                btn = self.driver.find_element(
-                    By.XPATH, "//button[contains(.,'Откликнуться')]"
-                )
-            except NoSuchElementException:
-                pass
-        
+            fallback = self.driver.find_elements(
+                By.XPATH, "//button[contains(.,'Откликнуться')]"
+            )
+            btn = fallback[0] if fallback else None
+
         if btn is None:
             return False
         
         self.helper.safe_click(btn)
-        time.sleep(0.5)
-        
+
+        # Ждём реакцию страницы на отправку: смену URL или исчезновение
+        # модалки — на быстрой странице это десятки миллисекунд
+        try:
+            conditions = [EC.url_changes(current_url)]
+            if modal:
+                conditions.append(EC.staleness_of(modal))
+            WebDriverWait(self.driver, 1.5, poll_frequency=0.1).until(
+                EC.any_of(*conditions)
+            )
+        except TimeoutException:
+            pass
+
         new_url = self.driver.current_url
         if new_url != current_url:
             if any(x in new_url for x in ['test', 'vacancy_response', 'startedWithQuestion=true']):
@@ -289,14 +311,21 @@ class ApplicationModal:
         
         if modal:
             try:
-                WebDriverWait(self.driver, 1.5).until(EC.staleness_of(modal))
+                WebDriverWait(self.driver, 1.5, poll_frequency=0.1).until(
+                    EC.staleness_of(modal)
+                )
                 return True
             except TimeoutException:
                 pass
         
-        time.sleep(0.3)
+        # Последний шанс: модалка могла закрываться анимацией —
+        # ждём её исчезновения вместо фиксированной паузы
         try:
-            self.driver.find_element(By.CSS_SELECTOR, "[data-qa*='vacancy-response']")
-            return False
-        except NoSuchElementException:
+            WebDriverWait(self.driver, 0.5, poll_frequency=0.1).until(
+                lambda d: not d.find_elements(
+                    By.CSS_SELECTOR, "[data-qa*='vacancy-response']"
+                )
+            )
             return True
+        except TimeoutException:
+            return False
@@ -11,17 +11,18 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import (
     TimeoutException,
-    NoSuchElementException,
     ElementClickInterceptedException,
 )
 
 
 class SeleniumHelper:
     """Вспомогательные методы для работы с Selenium"""
-    
+
+    __slots__ = ('driver',)
+
     def __init__(self, driver: webdriver.Chrome):
         self.driver = driver
-    
+
     def safe_click(self, element) -> None:
         """Безопасный клик с fallback на JavaScript"""
         try:
@@ -29,48 +30,77 @@ class SeleniumHelper:
             return
         except ElementClickInterceptedException:
             pass
-        
-        try:
-            self.driver.execute_script(
-                "arguments[0].scrollIntoView({block: 'center'});", element
-            )
-            element.click()
-            return
-        except ElementClickInterceptedException:
-            self.driver.execute_script("arguments[0].click();", element)
+
+        # Прокрутка и клик одним вызовом JS вместо трёх обращений
+        # к браузеру (scroll, повторный click, JS-клик)
+        self.driver.execute_script(
+            "arguments[0].scrollIntoView({block: 'center'}); arguments[0].click();",
+            element
+        )
     
     def find_element_safe(self, selector: str, timeout: float = 0.5) -> Optional[any]:
         """Безопасный поиск элемента с ожиданием"""
         try:
-            return WebDriverWait(self.driver, timeout).until(
+            return WebDriverWait(self.driver, timeout, poll_frequency=0.1).until(
                 EC.presence_of_element_located((By.CSS_SELECTOR, selector))
             )
         except TimeoutException:
             return None
     
     def find_elements_safe(self, selector: str) -> List:
-        """Безопасный поиск нескольких элементов"""
-        try:
-            return self.driver.find_elements(By.CSS_SELECTOR, selector)
-        except Exception:
-            return []
+        """Поиск нескольких элементов: [] на промах, без исключений.
+
+        find_elements сам возвращает пустой список, когда элементов
+        нет — обёртка в try/except только прятала настоящие ошибки
+        драйвера и программные баги.
+        """
+        return self.driver.find_elements(By.CSS_SELECTOR, selector)
     
+    def find_first(self, joined_css: str, parent=None) -> Optional[any]:
+        """Возвращает первый элемент по CSS-селектору или None.
+
+        Использует find_elements, который на промах возвращает пустой
+        список вместо исключения — без дорогого exception-пути.
+        """
+        target = parent or self.driver
+        elements = target.find_elements(By.CSS_SELECTOR, joined_css)
+        return elements[0] if elements else None
+
     def find_by_selectors(self, selectors: List[str], parent=None) -> Optional[any]:
-        """Пробует найти элемент по списку селекторов"""
+        """Пробует найти элемент по списку селекторов (в порядке приоритета)"""
         target = parent or self.driver
         for selector in selectors:
-            try:
-                element = target.find_element(By.CSS_SELECTOR, selector)
-                if element:
-                    return element
-            except NoSuchElementException:
-                continue
+            elements = target.find_elements(By.CSS_SELECTOR, selector)
+            if elements:
+                return elements[0]
         return None
     
+    def wait_for_any(self, selectors: List[str], timeout: float = 1.0,
+                     stop_loading: bool = False) -> Optional[any]:
+        """Ожидает появления первого элемента из списка селекторов.
+
+        При stop_loading=True после появления элемента вызывает
+        window.stop(), обрывая фоновую догрузку рекламы и трекеров.
+        """
+        combined = ", ".join(selectors)
+        try:
+            element = WebDriverWait(self.driver, timeout, poll_frequency=0.1).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, combined))
+            )
+        except TimeoutException:
+            return None
+
+        if stop_loading:
+            try:
+                self.driver.execute_script("window.stop();")
+            except Exception:
+                pass
+        return element
+
     def wait_for_element(self, selector: str, timeout: float = 1.0) -> Optional[any]:
         """Ожидает появления элемента"""
         try:
-            return WebDriverWait(self.driver, timeout).until(
+            return WebDriverWait(self.driver, timeout, poll_frequency=0.1).until(
                 EC.presence_of_element_located((By.CSS_SELECTOR, selector))
             )
         except TimeoutException:
@@ -79,7 +109,9 @@ class SeleniumHelper:
     def wait_for_staleness(self, element, timeout: float = 0.5) -> bool:
         """Ожидает исчезновения элемента"""
         try:
-            WebDriverWait(self.driver, timeout).until(EC.staleness_of(element))
+            WebDriverWait(self.driver, timeout, poll_frequency=0.1).until(
+                EC.staleness_of(element)
+            )
             return True
         except TimeoutException:
             return False
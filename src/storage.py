@@ -2,90 +2,354 @@
 Хранилище для обработанных и пропущенных вакансий
 """
 
+import atexit
 import json
 import os
+import queue
+import tempfile
+import threading
 import time
-from typing import Dict, Tuple
+from typing import Dict, List, Tuple
 
 from .logger import get_logger
 
+# Опционально: orjson кодирует/декодирует JSON на Rust в разы быстрее
+# stdlib. Без него работаем на обычном json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj: Dict) -> str:
+        return orjson.dumps(obj).decode('utf-8')
+else:
+    _json_loads = json.loads
+
+    def _json_dumps(obj: Dict) -> str:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
 
 class VacancyStorage:
-    """Управление хранилищем обработанных и пропущенных вакансий"""
-    
-    def __init__(self, processed_file: str, skipped_file: str, save_interval: int = 10):
-        self.processed_file = processed_file
-        self.skipped_file = skipped_file
+    """Управление хранилищем обработанных и пропущенных вакансий.
+
+    Персистентность — append-only журналы JSON Lines: каждая отметка
+    дописывает одну строку вместо полной перезаписи словаря, поэтому
+    стоимость сохранения не растёт с историей. Словарь восстанавливается
+    при старте проходом по строкам (последняя запись с тем же id
+    побеждает); разбухший журнал сжимается compact().
+    """
+
+    def __init__(self, processed_file: str, skipped_file: str,
+                 save_interval: int = 10, max_entries: int = 0):
+        self.processed_file = self._jsonl_path(processed_file)
+        self.skipped_file = self._jsonl_path(skipped_file)
         self.save_interval = save_interval
+        # Верхняя граница записей, которые держим в памяти с полными
+        # метаданными (0 = без ограничения). Старейшие записи
+        # вытесняются из словарей, но их id остаются в множествах —
+        # is_known не даёт повторных откликов, а полная история
+        # в любом случае лежит в журнале на диске
+        self.max_entries = max_entries
+        # Логгер один раз в атрибут: хранилище создаётся после
+        # setup_logger, поэтому хэндл уже настроенный (захват на уровне
+        # модуля поймал бы логгер по умолчанию)
+        self._log = get_logger()
         self._save_counter = 0
-        
-        self.processed: Dict[str, Dict] = self._load_json(processed_file)
-        self.skipped: Dict[str, Dict] = self._load_json(skipped_file)
-    
+        # Общий штамп времени для отметок одного интервала сохранения:
+        # один вызов time.time() на батч вместо вызова на каждую отметку.
+        # Точность (±длительность интервала) для аудита достаточна
+        self._batch_ts = time.time()
+        # Защищает словари при параллельной обработке запросов
+        self._lock = threading.Lock()
+
+        self._migrate_legacy(processed_file, self.processed_file)
+        self._migrate_legacy(skipped_file, self.skipped_file)
+
+        self.processed: Dict[str, Dict]
+        self.skipped: Dict[str, Dict]
+        self.processed, self._processed_lines = self._load_jsonl(self.processed_file)
+        self.skipped, self._skipped_lines = self._load_jsonl(self.skipped_file)
+
+        # Отдельные множества id для быстрых проверок принадлежности;
+        # объединённое множество держим готовым — is_known сводится
+        # к одной проверке принадлежности вместо двух вызовов
+        self._processed_ids = set(self.processed)
+        self._skipped_ids = set(self.skipped)
+        self._all_ids = self._processed_ids | self._skipped_ids
+
+        # Метаданные сверх лимита усекаются сразу после загрузки
+        self._evict_overflow(self.processed)
+        self._evict_overflow(self.skipped)
+
+        # Строки, ожидающие дозаписи в журнал (сбрасываются фоновым
+        # потоком или синхронным save(force=True))
+        self._pending_processed: List[str] = []
+        self._pending_skipped: List[str] = []
+
+        # Фоновый поток записи: основной цикл только ставит заявку
+        # на сохранение и не ждёт диска. Очередь на один элемент —
+        # слившиеся заявки пишутся одним батчем
+        self._save_queue: queue.Queue = queue.Queue(maxsize=1)
+        self._save_thread = threading.Thread(
+            target=self._save_worker, daemon=True, name="storage-save"
+        )
+        self._save_thread.start()
+
+        # Сжимаем журналы, разбухшие за прошлые сессии
+        self.compact()
+
+        # Страховка: сбрасываем несохранённый прогресс при любом выходе
+        atexit.register(self.save, True)
+
     @staticmethod
-    def _load_json(filename: str) -> Dict:
-        """Загружает JSON файл или возвращает пустой словарь"""
-        logger = get_logger()
-        if os.path.exists(filename):
-            try:
-                with open(filename, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except (json.JSONDecodeError, IOError) as e:
-                logger.debug(f"Ошибка загрузки {filename}: {e}")
-        return {}
-    
-    def _save_json(self, filename: str, data: Dict) -> None:
-        """Сохраняет данные в JSON файл"""
-        logger = get_logger()
+    def _jsonl_path(filename: str) -> str:
+        """Возвращает путь журнала .jsonl для настроенного файла"""
+        root, ext = os.path.splitext(filename)
+        if ext == '.jsonl':
+            return filename
+        return root + '.jsonl'
+
+    def _migrate_legacy(self, json_path: str, jsonl_path: str) -> None:
+        """Переносит старый монолитный .json в журнал .jsonl.
+
+        Выполняется один раз: если журнал уже существует, старый файл
+        не трогаем (остаётся как резервная копия).
+        """
+        if json_path == jsonl_path or os.path.exists(jsonl_path):
+            return
+        if not os.path.exists(json_path):
+            return
+        try:
+            with open(json_path, 'rb') as f:
+                data = _json_loads(f.read())
+        except (ValueError, IOError) as e:
+            self._log.warn(f"Не удалось перенести {json_path}: {e}")
+            return
+        self._rewrite_jsonl(jsonl_path, data)
+        self._log.info(f"Хранилище перенесено: {json_path} -> {jsonl_path}")
+
+    def _load_jsonl(self, filename: str) -> Tuple[Dict, int]:
+        """Восстанавливает словарь из журнала JSON Lines.
+
+        Возвращает (словарь, число строк). Повторные записи одного id
+        перекрывают предыдущие, битые строки пропускаются.
+        """
+        data: Dict[str, Dict] = {}
+        lines = 0
+        if not os.path.exists(filename):
+            return data, lines
+        try:
+            with open(filename, 'r', encoding='utf-8') as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    lines += 1
+                    try:
+                        record = _json_loads(line)
+                        data[record.pop("id")] = record
+                    except (ValueError, KeyError) as e:
+                        self._log.debug("Битая строка в %s: %s", filename, e)
+        except IOError as e:
+            self._log.debug("Ошибка загрузки %s: %s", filename, e)
+        return data, lines
+
+    @staticmethod
+    def _encode_line(vacancy_id: str, record: Dict) -> str:
+        """Кодирует запись в одну компактную строку журнала.
+
+        Без пробелов после разделителей: меньше байт через кодировщик,
+        на диск и обратно при загрузке.
+        """
+        return _json_dumps({"id": vacancy_id, **record})
+
+    def _append_lines(self, filename: str, lines: List[str]) -> None:
+        """Дописывает строки в журнал одним вызовом"""
         try:
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            with open(filename, 'a', encoding='utf-8') as f:
+                f.write('\n'.join(lines) + '\n')
         except IOError as e:
-            logger.warn(f"Ошибка сохранения {filename}: {e}")
-    
+            self._log.warn(f"Ошибка записи {filename}: {e}")
+
+    def _rewrite_jsonl(self, filename: str, data: Dict) -> None:
+        """Атомарно переписывает журнал из словаря.
+
+        Пишем во временный файл и подменяем его через os.replace,
+        чтобы падение в середине записи не оставило битый файл.
+        """
+        tmp_path = None
+        try:
+            fd, tmp_path = tempfile.mkstemp(
+                dir=os.path.dirname(filename) or '.',
+                prefix=os.path.basename(filename) + '.',
+                suffix='.tmp'
+            )
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                for vacancy_id, record in data.items():
+                    f.write(self._encode_line(vacancy_id, record) + '\n')
+            os.replace(tmp_path, filename)
+            tmp_path = None
+        except (IOError, OSError) as e:
+            self._log.warn(f"Ошибка сохранения {filename}: {e}")
+        finally:
+            if tmp_path and os.path.exists(tmp_path):
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+
+    def compact(self) -> None:
+        """Сжимает журналы, в которых накопились перекрытые записи.
+
+        Переписывает файл из актуального словаря, когда строк стало
+        вдвое больше, чем записей. Словарь, усечённый вытеснением
+        (max_entries), не переписываем: журнал на диске — единственная
+        полная история.
+        """
+        with self._lock:
+            targets = []
+            if (len(self.processed) == len(self._processed_ids)
+                    and self._processed_lines > 2 * len(self.processed)):
+                targets.append((self.processed_file, dict(self.processed)))
+                self._processed_lines = len(self.processed)
+            if (len(self.skipped) == len(self._skipped_ids)
+                    and self._skipped_lines > 2 * len(self.skipped)):
+                targets.append((self.skipped_file, dict(self.skipped)))
+                self._skipped_lines = len(self.skipped)
+        for filename, data in targets:
+            self._rewrite_jsonl(filename, data)
+
+    def _save_worker(self) -> None:
+        """Цикл фонового потока: дописывает журнал по каждой заявке"""
+        while True:
+            self._save_queue.get()
+            try:
+                self._flush_pending()
+            finally:
+                self._save_queue.task_done()
+
+    def _flush_pending(self) -> None:
+        """Дописывает накопленные строки в журналы.
+
+        Буферы забираются под блокировкой, запись идёт без неё; пустые
+        буферы не трогают диск вовсе.
+        """
+        with self._lock:
+            processed = self._pending_processed
+            skipped = self._pending_skipped
+            if processed:
+                self._pending_processed = []
+            if skipped:
+                self._pending_skipped = []
+        if processed:
+            self._append_lines(self.processed_file, processed)
+        if skipped:
+            self._append_lines(self.skipped_file, skipped)
+
+    def request_save(self) -> None:
+        """Ставит неблокирующую заявку на сохранение в фоновый поток"""
+        try:
+            self._save_queue.put_nowait(True)
+        except queue.Full:
+            # Сохранение уже запланировано — батч заберёт и наши строки
+            pass
+
     def save(self, force: bool = False) -> None:
-        """Сохраняет данные с учётом интервала"""
-        self._save_counter += 1
-        if force or self._save_counter % self.save_interval == 0:
-            self._save_json(self.processed_file, self.processed)
-            self._save_json(self.skipped_file, self.skipped)
-    
+        """Сохраняет данные с учётом интервала.
+
+        Интервальные сохранения уходят в фоновый поток; force=True
+        (выход, конец запроса) пишет синхронно, чтобы прогресс
+        гарантированно оказался на диске.
+        """
+        if force:
+            self._flush_pending()
+            return
+        with self._lock:
+            self._save_counter += 1
+            due = self._save_counter % self.save_interval == 0
+            if due:
+                self._batch_ts = time.time()
+        if due:
+            self.request_save()
+
     def is_processed(self, vacancy_id: str) -> bool:
         """Проверяет, была ли вакансия обработана"""
-        return vacancy_id in self.processed
-    
+        return vacancy_id in self._processed_ids
+
     def is_skipped(self, vacancy_id: str) -> bool:
         """Проверяет, была ли вакансия пропущена"""
-        return vacancy_id in self.skipped
-    
+        return vacancy_id in self._skipped_ids
+
+    def known_ids(self) -> frozenset:
+        """Возвращает снимок всех известных id одним объектом.
+
+        Для горячих циклов, где проверять принадлежность выгоднее по
+        локальному frozenset, чем дёргать is_processed/is_skipped
+        (и их блокировку) на каждую карточку.
+        """
+        with self._lock:
+            return frozenset(self._all_ids)
+
     def is_known(self, vacancy_id: str) -> bool:
         """Проверяет, известна ли вакансия (обработана или пропущена)"""
-        return self.is_processed(vacancy_id) or self.is_skipped(vacancy_id)
-    
-    def mark_processed(self, vacancy_id: str, title: str, status: str, 
+        return vacancy_id in self._all_ids
+
+    def mark_processed(self, vacancy_id: str, title: str, status: str,
                        cover_letter: bool = False) -> None:
         """Помечает вакансию как обработанную"""
-        self.processed[vacancy_id] = {
+        record = {
             "title": title,
             "status": status,
             "cover_letter": cover_letter,
-            "timestamp": time.time()
+            "timestamp": self._batch_ts
         }
+        with self._lock:
+            self.processed[vacancy_id] = record
+            self._processed_ids.add(vacancy_id)
+            self._all_ids.add(vacancy_id)
+            self._pending_processed.append(self._encode_line(vacancy_id, record))
+            self._processed_lines += 1
+            self._evict_overflow(self.processed)
         self.save()
-    
+
     def mark_skipped(self, vacancy_id: str, title: str, reason: str) -> None:
         """Помечает вакансию как пропущенную"""
-        self.skipped[vacancy_id] = {
+        record = {
             "title": title,
             "reason": reason,
-            "timestamp": time.time()
+            "timestamp": self._batch_ts
         }
+        with self._lock:
+            self.skipped[vacancy_id] = record
+            self._skipped_ids.add(vacancy_id)
+            self._all_ids.add(vacancy_id)
+            self._pending_skipped.append(self._encode_line(vacancy_id, record))
+            self._skipped_lines += 1
+            self._evict_overflow(self.skipped)
         self.save()
-    
+
+    def _evict_overflow(self, data: Dict) -> None:
+        """Вытесняет старейшие записи сверх max_entries (под блокировкой).
+
+        Словари хранят порядок вставки — первый ключ и есть старейший.
+        Трогаем только метаданные: множества id остаются полными.
+        """
+        if not self.max_entries:
+            return
+        while len(data) > self.max_entries:
+            del data[next(iter(data))]
+
     def get_stats(self) -> Tuple[int, int]:
-        """Возвращает статистику (обработано, пропущено)"""
-        return len(self.processed), len(self.skipped)
-    
+        """Возвращает статистику (обработано, пропущено).
+
+        Считает по множествам id — они полные даже при включённом
+        вытеснении метаданных.
+        """
+        return len(self._processed_ids), len(self._skipped_ids)
+
     def get_applied_count(self) -> int:
         """Возвращает количество успешных откликов"""
         return sum(1 for v in self.processed.values() if v.get('status') == 'applied')
@@ -3,18 +3,25 @@
 """
 
 import hashlib
+import re
 from typing import List, Optional
 
 from selenium.webdriver.common.by import By
-from selenium.common.exceptions import NoSuchElementException
 
 from .selenium_helper import SeleniumHelper
 from .logger import get_logger
 
+# Id вакансии из href одним проходом регулярки — без промежуточных
+# списков от цепочки split
+_VACANCY_ID_RE = re.compile(r"/vacancy/(\d+)")
+
 
 class VacancyCard:
     """Представляет карточку вакансии в результатах поиска"""
-    
+
+    # Карточек создаются сотни за сессию: слоты вместо __dict__
+    __slots__ = ('element', 'helper', '_id', '_title', '_title_bytes')
+
     TITLE_SELECTORS = [
         "[data-qa='vacancy-serp__vacancy-title']",
         "[data-qa='serp-item__title']",
@@ -29,21 +36,65 @@ class VacancyCard:
     ]
     
     APPLY_BUTTON_SELECTOR = "[data-qa='vacancy-serp__vacancy_response']"
+    # Активная кнопка отклика целиком через атрибуты: не нужно
+    # выгружать локализованный текст кнопки отдельным запросом
+    APPLY_ENABLED_CSS = APPLY_BUTTON_SELECTOR + ":not([disabled])"
+
+    # Объединённая CSS-группа (см. ApplicationModal): один запрос
+    # к браузеру вместо перебора селекторов по одному
+    TITLE_CSS = ", ".join(TITLE_SELECTORS)
+
+    # Собирает id, заголовок и наличие кнопки отклика всех карточек
+    # одним вызовом JS вместо 3-4 запросов к браузеру на каждую карточку.
+    # Селекторы приходят аргументами — источник истины остаётся
+    # в атрибутах класса выше
+    _BULK_EXTRACT_JS = """
+        var titleCss = arguments[1], applyCss = arguments[2];
+        return Array.from(document.querySelectorAll(arguments[0])).map(function (card) {
+            var id = card.getAttribute('data-vacancy-id')
+                || (card.id || '').replace('vacancy_', '');
+            if (!id) {
+                var link = card.querySelector("a[href*='/vacancy/']");
+                var m = link && link.href.match(/\\/vacancy\\/(\\d+)/);
+                if (m) { id = m[1]; }
+            }
+            var title = card.querySelector(titleCss);
+            return {
+                id: id || null,
+                title: title ? title.innerText.trim() : '',
+                hasApply: !!card.querySelector(applyCss)
+            };
+        });
+    """
+
+    @classmethod
+    def bulk_extract(cls, driver, card_selector: str) -> List[dict]:
+        """Возвращает метаданные всех карточек страницы одним запросом"""
+        try:
+            return driver.execute_script(
+                cls._BULK_EXTRACT_JS, card_selector,
+                cls.TITLE_CSS, cls.APPLY_ENABLED_CSS
+            ) or []
+        except Exception as e:
+            get_logger().debug("Не удалось собрать метаданные карточек: %s", e)
+            return []
     
-    def __init__(self, card_element, helper: SeleniumHelper):
+    def __init__(self, card_element, helper: SeleniumHelper,
+                 vacancy_id: Optional[str] = None, title: Optional[str] = None):
         self.element = card_element
         self.helper = helper
-        self._id: Optional[str] = None
-        self._title: Optional[str] = None
+        # Если id/заголовок уже извлечены пакетным JS, не ходим в DOM повторно
+        self._id: Optional[str] = vacancy_id
+        self._title: Optional[str] = title
+        # UTF-8 представление заголовка, закэшированное для хеша
+        self._title_bytes: Optional[bytes] = None
     
     @property
     def id(self) -> Optional[str]:
         """Возвращает ID вакансии"""
         if self._id is not None:
             return self._id
-        
-        logger = get_logger()
-        
+
         try:
             # Пробуем атрибут data-vacancy-id
             vacancy_id = self.element.get_attribute('data-vacancy-id')
@@ -51,19 +102,34 @@ class VacancyCard:
                 self._id = vacancy_id
                 return self._id
             
-            # Пробуем извлечь из ссылки
-            link = self.helper.find_by_selectors(self.LINK_SELECTORS, self.element)
+            # Пробуем извлечь из ссылки. Быстрый путь — самый частый
+            # data-qa-селектор одним запросом; широкий список (вплоть до
+            # дорогого a[href*=...] по всей карточке) — только на промахе
+            link = self.helper.find_first(self.LINK_SELECTORS[0], self.element)
+            if link is None:
+                link = self.helper.find_by_selectors(
+                    self.LINK_SELECTORS[1:], self.element
+                )
             if link:
                 href = link.get_attribute('href')
-                if href and '/vacancy/' in href:
-                    self._id = href.split('/vacancy/')[1].split('?')[0]
-                    return self._id
+                if href:
+                    m = _VACANCY_ID_RE.search(href)
+                    if m:
+                        self._id = m.group(1)
+                        return self._id
         except Exception as e:
-            logger.debug(f"Не удалось получить ID вакансии: {e}")
+            # Логгер берём только на редком пути ошибки
+            get_logger().debug("Не удалось получить ID вакансии: %s", e)
         
-        # Fallback на хеш заголовка
+        # Fallback на хеш заголовка: blake2b с 6-байтовым дайджестом
+        # быстрее md5 и даёт нужные 12 hex-символов без среза.
+        # Байты заголовка кодируем один раз на карточку
         if self.title:
-            self._id = "hash_" + hashlib.md5(self.title.encode()).hexdigest()[:12]
+            if self._title_bytes is None:
+                self._title_bytes = self._title.encode('utf-8')
+            self._id = "hash_" + hashlib.blake2b(
+                self._title_bytes, digest_size=6
+            ).hexdigest()
         
         return self._id
     
@@ -73,30 +139,24 @@ class VacancyCard:
         if self._title is not None:
             return self._title
         
-        for selector in self.TITLE_SELECTORS:
-            try:
-                el = self.element.find_element(By.CSS_SELECTOR, selector)
-                text = el.text.strip()
-                if text:
-                    self._title = text
-                    return self._title
-            except NoSuchElementException:
-                continue
-        
-        self._title = ""
+        els = self.element.find_elements(By.CSS_SELECTOR, self.TITLE_CSS)
+        self._title = els[0].text.strip() if els else ""
         return self._title
     
     def get_apply_button(self):
-        """Возвращает кнопку 'Откликнуться' или None"""
-        try:
-            btn = self.element.find_element(By.CSS_SELECTOR, self.APPLY_BUTTON_SELECTOR)
-            if "Откликнуться" in btn.text:
-                return btn
-        except NoSuchElementException:
-            pass
-        return None
+        """Возвращает активную кнопку 'Откликнуться' или None.
+
+        Отбор по data-qa и :not([disabled]) прямо в селекторе: промах —
+        пустой список без исключения, совпадение не требует выгружать
+        текст кнопки отдельным запросом.
+        """
+        btns = self.element.find_elements(By.CSS_SELECTOR, self.APPLY_ENABLED_CSS)
+        return btns[0] if btns else None
     
-    def is_suitable(self, keywords: List[str]) -> bool:
-        """Проверяет, подходит ли вакансия по ключевым словам"""
-        title_lower = self.title.lower()
-        return any(kw.lower() in title_lower for kw in keywords)
+    def is_suitable(self, keyword_pattern) -> bool:
+        """Проверяет, подходит ли вакансия по ключевым словам.
+
+        Ожидает заранее скомпилированный re.Pattern со всеми
+        ключевыми словами (см. HHApplierBot.__init__).
+        """
+        return bool(keyword_pattern.search(self.title))